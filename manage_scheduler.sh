@@ -28,7 +28,7 @@ case "$1" in
     test)
         echo "Running scraper manually for testing..."
         cd "$SCRIPT_DIR"
-        python3 scrape_earnings_selenium_final.py
+        python3 scrape_earnings_selenium_final.py --selenium-fallback
         ;;
     logs)
         echo "=== OUTPUT LOG ==="
@@ -3,73 +3,279 @@
 Scheduled earnings scraper that runs automatically
 """
 
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+import asyncio
+import atexit
+import fcntl
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from scrape_earnings_selenium_final import EarningsSeleniumScraper
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scheduler.log'),
-        logging.StreamHandler()
-    ]
-)
-
-def run_earnings_scraper():
-    """Run the earnings scraper"""
-    scraper = None
+import orjson
+import pytz
+from scrape_earnings_selenium_final import BrowserPool, EarningsSeleniumScraper
+from writer import BatchedFileWriter
+
+# Number of headless browsers kept warm between cron ticks (1-4)
+POOL_SIZE = 2
+# Quit and relaunch a pooled browser after this many scrapes to bound memory drift
+BROWSER_POOL_RECYCLE_AFTER = 100
+# Upper bound on dates scraped concurrently within one tick
+MAX_CONCURRENCY = 5
+# Successful scrapes are reused for this long, so manual runs and backfills don't re-fetch
+CACHE_DIR = os.path.join('data', 'calendar_cache')
+CACHE_TTL_SECONDS = 6 * 3600
+# Attempts per date (with exponential backoff) before giving up
+SCRAPE_ATTEMPTS = 3
+# Stop scraping for the rest of a tick after this many consecutive failures
+CIRCUIT_BREAKER_THRESHOLD = 5
+
+# Built in main(); shared by every scrape so Chrome is launched once, not once per date
+_BROWSER_POOL = None
+# One worker thread per pooled browser, kept apart from the loop's default executor
+_SCRAPE_EXECUTOR = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix='scraper')
+# Persists scraped payloads in the background instead of writing on the scraping path
+_WRITER = BatchedFileWriter()
+
+_CONSECUTIVE_FAILURES = 0
+_FAILURES_LOCK = threading.Lock()
+
+# Bound once so the per-tick path skips repeated attribute lookups
+_EASTERN = pytz.timezone('US/Eastern')
+_now = datetime.now
+_log_info = logging.info
+_log_warn = logging.warning
+_log_err = logging.error
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with per-phase timings attached by _timed()"""
+
+    def format(self, record):
+        entry = {"ts": record.created, "lvl": record.levelname, "msg": record.getMessage()}
+        phase = getattr(record, 'phase', None)
+        if phase is not None:
+            entry["phase"] = phase
+            entry["ms"] = record.ms
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+@contextmanager
+def _timed(phase):
+    """Log how long the wrapped block took, measured on the monotonic clock"""
+    start = time.perf_counter_ns()
     try:
-        logging.info("Starting scheduled earnings scraper...")
-        
-        # Get today's date in YYYYMMDD format using Eastern Time
-        import pytz
-        eastern = pytz.timezone('US/Eastern')
-        today_eastern = datetime.now(eastern)
-        today = today_eastern.strftime("%Y%m%d")
-        
-        scraper = EarningsSeleniumScraper(headless=True, debug=False)
-        data = scraper.scrape_calendar(today)
-        
-        if data and data.get('status') == 'success':
-            companies = data.get('companies', [])
-            logging.info(f"Successfully scraped {len(companies)} companies for {today}")
-        else:
-            logging.warning(f"Scraping failed or no data found for {today}")
-            
-    except Exception as e:
-        logging.error(f"Error in scheduled scraper: {e}")
+        yield
     finally:
-        if scraper:
-            scraper.close()
+        ms = (time.perf_counter_ns() - start) / 1e6
+        _log_info(f"{phase} took {ms:.1f} ms", extra={'phase': phase, 'ms': round(ms, 3)})
+
+def setup_logging():
+    """
+    Route log records through a queue so scheduler and worker threads never block on disk.
+    A background QueueListener owns the real file (and, on a TTY, console) handlers.
+    """
+    log_queue = queue.Queue(-1)
+    formatter = JsonFormatter()
+
+    handlers = [logging.handlers.RotatingFileHandler('scheduler.log', maxBytes=10_000_000, backupCount=5)]
+    # Only echo to the console interactively; under launchd/cron stdout is a pipe that can back-pressure
+    if sys.stderr.isatty():
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+def _dates_to_scrape():
+    """Dates (YYYYMMDD, Eastern Time) to scrape on this tick"""
+    n = _now(_EASTERN)
+    return [f"{n.year:04d}{n.month:02d}{n.day:02d}"]
+
+def _cache_path(date_str):
+    return os.path.join(CACHE_DIR, f"{date_str}.json")
+
+def _load_cached(date_str):
+    """Return the cached calendar for a date if it is still fresh"""
+    path = _cache_path(date_str)
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_TTL_SECONDS:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _store_cached(date_str, data):
+    """
+    Queue a successful, non-empty scrape for atomic caching on the background writer.
+    Returns a Future that resolves once the file is on disk, or None if nothing was queued.
+    """
+    if not data or data.get('status') != 'success' or not data.get('companies'):
+        return None
+    payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return _WRITER.submit(_cache_path(date_str), payload)
+
+def _lock_cache(date_str):
+    """Take an exclusive lock on a date so overlapping triggers don't double-fetch (blocking)"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    lock_file = open(f"{_cache_path(date_str)}.lock", 'w')
+    fcntl.flock(lock_file, fcntl.LOCK_EX)
+    return lock_file
+
+def _unlock_cache(lock_file):
+    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    lock_file.close()
+
+def _record_failure():
+    """Count a failed attempt; returns True once the circuit breaker is open"""
+    global _CONSECUTIVE_FAILURES
+    with _FAILURES_LOCK:
+        _CONSECUTIVE_FAILURES += 1
+        return _CONSECUTIVE_FAILURES >= CIRCUIT_BREAKER_THRESHOLD
+
+def _record_success():
+    """Reset the consecutive-failure count"""
+    global _CONSECUTIVE_FAILURES
+    with _FAILURES_LOCK:
+        _CONSECUTIVE_FAILURES = 0
+
+def _scrape_date(date_str):
+    """Scrape one date, falling back to a pooled browser (blocking, runs in an executor thread)"""
+    if _CONSECUTIVE_FAILURES >= CIRCUIT_BREAKER_THRESHOLD:
+        _log_err(f"Skipping {date_str}: {_CONSECUTIVE_FAILURES} consecutive scrape failures this tick")
+        return None
+
+    try:
+        # Cheap per call: browsers belong to the pool, which discards any that fail mid-scrape
+        # navigate and parse are timed inside the scrape, which is timed as a whole below
+        scraper = EarningsSeleniumScraper(headless=True, debug=False, pool=_BROWSER_POOL, timer=_timed)
+        for attempt in range(SCRAPE_ATTEMPTS):
+            # The TTL cache above decides when a date is refetched, so the scraper's own cache is bypassed
+            with _timed("scrape"):
+                data = scraper.scrape_calendar(date_str, force_refresh=True)
+            if data is not None:
+                _record_success()
+                return data
+            _log_warn(f"Attempt {attempt + 1} for {date_str} returned no data")
+
+            if _record_failure():
+                _log_err(f"Circuit breaker open after {_CONSECUTIVE_FAILURES} consecutive failures, giving up on {date_str}")
+                return None
+
+            if attempt + 1 < SCRAPE_ATTEMPTS:
+                time.sleep(min(60, 2 ** attempt))
+
+        return None
+
+    except Exception as e:
+        _log_err(f"Error in scheduled scraper for {date_str}: {e}")
+        return None
+
+async def _scrape_one(date_str, semaphore):
+    """Scrape one date without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    async with semaphore:
+        data = _load_cached(date_str)
+        if data is not None:
+            _log_info(f"Using cached calendar for {date_str}")
+        else:
+            lock_file = await loop.run_in_executor(None, _lock_cache, date_str)
+            try:
+                # Another trigger may have filled the cache while we waited for the lock
+                data = _load_cached(date_str)
+                if data is None:
+                    data = await loop.run_in_executor(_SCRAPE_EXECUTOR, _scrape_date, date_str)
+                    stored = _store_cached(date_str, data)
+                    if stored is not None:
+                        # Hold the lock until the write lands so a waiting trigger sees the cache
+                        try:
+                            with _timed("persist"):
+                                await asyncio.wrap_future(stored)
+                        except OSError as e:
+                            _log_warn(f"Error caching calendar for {date_str}: {e}")
+            finally:
+                _unlock_cache(lock_file)
+
+    if data and data.get('status') == 'success':
+        companies = data.get('companies', [])
+        _log_info(f"Successfully scraped {len(companies)} companies for {date_str}")
+    else:
+        _log_warn(f"Scraping failed or no data found for {date_str}")
+
+async def run_earnings_scraper():
+    """Run the earnings scraper"""
+    _log_info("Starting scheduled earnings scraper...")
+    # The circuit breaker only spans a single tick
+    _record_success()
+
+    # Each date holds a pooled browser, so never run more dates than browsers
+    semaphore = asyncio.Semaphore(min(MAX_CONCURRENCY, POOL_SIZE))
+    await asyncio.gather(*[_scrape_one(d, semaphore) for d in _dates_to_scrape()])
 
 def main():
     """Main scheduler function"""
-    scheduler = BlockingScheduler()
-    
+    setup_logging()
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    # Collapse missed/overlapping ticks (e.g. after the machine sleeps) into a single run
+    scheduler = AsyncIOScheduler(
+        event_loop=loop,
+        jobstores={'default': MemoryJobStore()},
+        job_defaults={'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 600}
+    )
+
     # Schedule to run Monday-Friday at 6:00 AM
     scheduler.add_job(
         run_earnings_scraper,
         CronTrigger(hour=6, minute=0, day_of_week='mon-fri'),
-        id='earnings_scraper',
         name='Daily Earnings Scraper'
     )
-    
+
     # Schedule to run immediately for testing (optional)
     # scheduler.add_job(run_earnings_scraper, 'interval', seconds=10, id='test_run')
-    
+
+    # Pre-launch the browser pool so cron ticks don't pay Chrome startup
+    global _BROWSER_POOL
+    _BROWSER_POOL = BrowserPool(size=POOL_SIZE, max_uses=BROWSER_POOL_RECYCLE_AFTER)
+    logging.info(f"Launching browser pool ({POOL_SIZE} headless browsers)...")
+    try:
+        with _timed("launch"):
+            _BROWSER_POOL.warm()
+    except Exception as e:
+        # Slots that failed to launch stay empty and are launched on first checkout
+        _log_err(f"Browser pool warm-up failed, browsers will launch lazily: {e}")
+
     logging.info("Scheduler started. Jobs:")
     for job in scheduler.get_jobs():
         logging.info(f"  - {job.name}: {job.trigger}")
-    
+
+    scheduler.start()
     try:
-        scheduler.start()
-    except KeyboardInterrupt:
+        loop.run_forever()
+    except (KeyboardInterrupt, SystemExit):
         logging.info("Scheduler stopped by user")
         scheduler.shutdown()
+    finally:
+        _SCRAPE_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _WRITER.close()
+        _BROWSER_POOL.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
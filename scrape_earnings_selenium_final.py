@@ -2,6 +2,7 @@
 """
 Final Selenium-based scraper for EarningsWhispers.com
 Properly handles the website's specific cookie acceptance mechanism.
+Calendars are fetched over plain HTTP first; Selenium is only used for JS-gated pages.
 """
 
 from selenium import webdriver
@@ -9,56 +10,719 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.chrome.service import Service
+import argparse
+import asyncio
+import bisect
+import functools
 import json
-import time
 import os
 import glob
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager, nullcontext
 from datetime import datetime
 import re
+import sqlite3
+import sys
+import httpx
+import lxml.etree
+import lxml.html
+
+try:
+    import orjson
+except ImportError:  # Saving falls back to the stdlib json module
+    orjson = None
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+EW_HOME_URL = "https://www.earningswhispers.com/"
+# Accepting the site's cookie policy sets this; seeding it up front skips the cookie wall
+CONSENT_COOKIE = {"name": ".AspNet.Consent", "value": "yes", "domain": "www.earningswhispers.com", "path": "/", "secure": True}
+
+def _http_cookies():
+    """Cookies sent with every plain HTTP fetch, so the server renders the calendar, not the cookie wall"""
+    cookies = httpx.Cookies()
+    cookies.set(CONSENT_COOKIE['name'], CONSENT_COOKIE['value'],
+                domain=CONSENT_COOKIE['domain'], path=CONSENT_COOKIE['path'])
+    return cookies
+
+# Shared so repeated dates reuse the same TCP/TLS connections
+_HTTP_CLIENT = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=20),
+    timeout=20,
+    follow_redirects=True,
+    headers={'User-Agent': USER_AGENT},
+    cookies=_http_cookies()
+)
+
+# Resources Chrome is told not to request at all
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff*", "*.ttf", "*.otf", "*.mp4", "*.webm",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*hotjar*",
+    "*googlesyndication*", "*adservice.google*", "*facebook.net*", "*scorecardresearch*", "*quantserve*"
+]
+
+# Extracted calendars: reused forever once fetched after their date had passed, otherwise for the
+# rest of the day they were fetched
+RESULT_CACHE_PATH = os.path.join('data', 'calendar_results.sqlite3')
+
+def _result_cache():
+    os.makedirs(os.path.dirname(RESULT_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(RESULT_CACHE_PATH, timeout=30)
+    # Keyed by URL so the pre- and post-market views of a date (/1 and /2) are kept apart
+    conn.execute("CREATE TABLE IF NOT EXISTS calendars(url TEXT, date_str TEXT, fetched_on TEXT, json BLOB, "
+                 "PRIMARY KEY(url, fetched_on))")
+    return conn
+
+def _load_cached_result(url, date_str):
+    """
+    Return the extracted calendar cached for url (the calendar page for date_str), or None. A calendar
+    fetched after its date had passed no longer changes and is reused forever; otherwise only today's
+    fetch counts.
+    """
+    try:
+        with closing(_result_cache()) as conn:
+            row = conn.execute(
+                "SELECT json FROM calendars WHERE url = ? AND (fetched_on > date_str OR fetched_on = ?) "
+                "ORDER BY fetched_on DESC LIMIT 1",
+                (url, datetime.now().strftime("%Y%m%d"))
+            ).fetchone()
+    except sqlite3.Error as e:
+        print(f"Error reading result cache: {e}")
+        return None
+    if row is None:
+        return None
+    return orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+
+def _store_cached_result(url, date_str, earnings_data):
+    """
+    Cache a successful extraction of url (the calendar page for date_str) under today's date, and
+    prune the rows no lookup can return any more so the cache doesn't grow without bound
+    """
+    if not earnings_data or earnings_data.get('status') != 'success':
+        return
+    if orjson is not None:
+        payload = orjson.dumps(earnings_data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(earnings_data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    today = datetime.now().strftime("%Y%m%d")
+    try:
+        with closing(_result_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO calendars(url, date_str, fetched_on, json) VALUES (?, ?, ?, ?)",
+                (url, date_str, today, payload)
+            )
+            # Older fetches of this URL are superseded by today's
+            conn.execute("DELETE FROM calendars WHERE url = ? AND fetched_on < ?", (url, today))
+            # Fetches made on or before their date, on an earlier day, are never read again
+            conn.execute("DELETE FROM calendars WHERE fetched_on < ? AND fetched_on <= date_str", (today,))
+    except sqlite3.Error as e:
+        print(f"Error writing result cache: {e}")
+
+# Cookies saved after getting through the cookie wall, restored into new browser sessions
+COOKIE_JAR_PATH = os.path.join('data', 'cookies.json')
+
+def _load_cookie_jar():
+    """Return the cookies saved by an earlier session, or an empty list"""
+    try:
+        with open(COOKIE_JAR_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+def _save_cookie_jar(cookies):
+    """Save the browser's cookies atomically for later sessions"""
+    try:
+        os.makedirs(os.path.dirname(COOKIE_JAR_PATH), exist_ok=True)
+        tmp_path = f"{COOKIE_JAR_PATH}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cookies, f, indent=2)
+        os.replace(tmp_path, COOKIE_JAR_PATH)
+    except OSError as e:
+        print(f"Error saving cookies: {e}")
+
+def _cdp_cookie(cookie):
+    """Translate a WebDriver cookie dict (as get_cookies() returns) into Network.setCookie params"""
+    params = {key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly') if key in cookie}
+    if 'expiry' in cookie:
+        params['expires'] = cookie['expiry']
+    if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+        params['sameSite'] = cookie['sameSite']
+    # DevTools needs a domain or a URL to scope the cookie to
+    if 'domain' not in params:
+        params['url'] = EW_HOME_URL
+    return params
+
+async def fetch_calendar_html_many(urls):
+    """Fetch several calendar pages concurrently; each result is the page HTML or None, in url order"""
+    async def fetch(client, url):
+        try:
+            response = await client.get(url)
+        except httpx.HTTPError as e:
+            print(f"HTTP fetch failed for {url}: {e}")
+            return None
+        if response.status_code != 200 or not response.text.strip():
+            return None
+        return response.text
+    
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=20),
+        timeout=20,
+        follow_redirects=True,
+        headers={'User-Agent': USER_AGENT},
+        cookies=_http_cookies()
+    ) as client:
+        return await asyncio.gather(*[fetch(client, url) for url in urls])
+
+def fetch_calendar_html(url):
+    """Fetch a calendar page without a browser; returns None on HTTP errors or empty pages"""
+    try:
+        response = _HTTP_CLIENT.get(url)
+    except httpx.HTTPError as e:
+        print(f"HTTP fetch failed for {url}: {e}")
+        return None
+
+    if response.status_code != 200 or not response.text.strip():
+        return None
+    return response.text
+
+# Debug lines buffered per scraper before they are written out in one go
+DEBUG_FLUSH_LINES = 1024
+
+# Seconds to wait for the calendar to render before extracting whatever is on the page
+CALENDAR_READY_TIMEOUT = 20
+# Seconds to wait for the page to reload past the cookie wall after accepting it
+COOKIE_WALL_TIMEOUT = 10
+# Table symbols needed before the noisier fallback strategies are skipped; a real calendar day
+# lists far more, while a sidebar quote or index table on the page shell lists a handful
+MIN_TABLE_COMPANIES = 10
+# True once the calendar has rendered rows (table or EPS cards) or says there is nothing to show.
+# Table rows only count at a calendar's worth (the shell's sidebar table has a header and a row or
+# two), and EPS cards only inside the calendar container; a bare [class*='eps'] also matches
+# "steps"/"deps" classes in the page shell
+_CALENDAR_READY_JS = f"""
+    return document.querySelectorAll('table tr').length > {MIN_TABLE_COMPANIES} ||
+           document.querySelector("#showcal [class*='eps'], [id*='showcal'] [class*='eps'], " +
+                                  ".showlist [class*='eps']") !== null ||
+           document.body.innerText.includes('No earnings');
+"""
+
+# True while the cookie acceptance wall is showing
+_COOKIE_WALL_JS = """
+    return document.getElementById('acceptCookies') !== null ||
+           (document.body !== null && document.body.innerText.includes('Accept Cookies'));
+"""
+
+# Extractor patterns, compiled once at import instead of per line/element
+_TICKER_RE = re.compile(r'\b([A-Z]{1,5})\b')
+_SYMBOL_RE = re.compile(r'[A-Z]{1,5}\Z')
+_JSON_SYMBOL_RE = re.compile(r'"(?:symbol|ticker|Symbol)"\s*:\s*"([A-Z]{1,5})"')
+# Date extraction (getcalctrls) and download function (adddownload) calls, in one scan
+_JS_DATE_RE = re.compile(r'getcalctrls\(["\'](\d{8})["\']|adddownload\(["\'](\d{8})["\']')
+_EW_SYMBOL_RE = re.compile(r'\b([A-Z]{2,5})\b')
+# Whole lines of page text that mention one of the financial context words
+_FINANCIAL_LINE_RE = re.compile(r'^(.*(?:earnings|eps|\$|revenue|profit|consensus|estimate|whisper).*)$', re.I | re.M)
+
+# Revenue figures as (tag, pattern) in priority order: the first pattern that matches anywhere
+# wins. Revenue and growth patterns are written in lower case and run, case-sensitively, against
+# text that was lower-cased once, which is cheaper than IGNORECASE folding every character
+_REVENUE_PATTERNS = (
+    # First try to find "Reported Revenue" specifically
+    ('rep_bil', r'reported revenue:\s*\$?([0-9,]+(?:\.[0-9]+)?)\s*(bil|billion|b)'),
+    ('rep_mil', r'reported revenue:\s*\$?([0-9,]+(?:\.[0-9]+)?)\s*(mil|million|m)'),
+    ('rep_loose_bil', r'reported\s+revenue[:\s]*\$?([0-9,]+(?:\.[0-9]+)?)\s*(bil|billion|b)'),
+    ('rep_loose_mil', r'reported\s+revenue[:\s]*\$?([0-9,]+(?:\.[0-9]+)?)\s*(mil|million|m)'),
+    # Fallback to general revenue patterns (avoiding "Estimate")
+    ('rev_bil', r'revenue:\s*\$?([0-9,]+(?:\.[0-9]+)?)\s*(bil|billion|b)(?!\s*estimate)'),
+    ('rev_mil', r'revenue:\s*\$?([0-9,]+(?:\.[0-9]+)?)\s*(mil|million|m)(?!\s*estimate)'),
+    ('dollar_bil', r'\$([0-9,]+(?:\.[0-9]+)?)\s*(bil|billion|b)(?!\s*estimate)'),
+    ('dollar_mil', r'\$([0-9,]+(?:\.[0-9]+)?)\s*(mil|million|m)(?!\s*estimate)'),
+    ('suffix_bil', r'([0-9,]+(?:\.[0-9]+)?)\s*(bil|billion|b)\s*revenue(?!\s*estimate)'),
+    ('suffix_mil', r'([0-9,]+(?:\.[0-9]+)?)\s*(mil|million|m)\s*revenue(?!\s*estimate)')
+)
+_REVENUE_PRIORITY = {tag: priority for priority, (tag, _) in enumerate(_REVENUE_PATTERNS)}
+# All revenue patterns fused into one scan, each branch wrapped in a group named after its tag.
+# Each position reports the highest-priority branch matching there; the lookahead keeps matches
+# zero-width so no position is skipped
+_REVENUE_UNION = re.compile('(?=' + '|'.join(f'(?P<{tag}>{p})' for tag, p in _REVENUE_PATTERNS) + ')')
+
+def _original_group(text, lowered, match, group):
+    """Return a group matched in lowered as it appears in the original text"""
+    # lower() only changes the length of a few non-ASCII letters; keep the lowered slice then
+    if len(text) != len(lowered):
+        return match.group(group)
+    return text[match.start(group):match.end(group)]
+
+def _search_revenue(text, lowered):
+    """
+    Single-scan equivalent of trying _REVENUE_PATTERNS in order and keeping the first one that
+    matches (at its leftmost match). lowered is text.lower(). Returns (matched text, amount,
+    unit) or None; the unit is lower case.
+    """
+    best_priority = best_match = None
+    for match in _REVENUE_UNION.finditer(lowered):
+        # The tagged whole-branch group closes last, so lastgroup names the branch that matched
+        priority = _REVENUE_PRIORITY[match.lastgroup]
+        if best_priority is None or priority < best_priority:
+            best_priority, best_match = priority, match
+            if priority == 0:
+                break
+    if best_match is None:
+        return None
+    # The branch's amount and unit groups directly follow its tagged group
+    group = _REVENUE_UNION.groupindex[best_match.lastgroup]
+    return (_original_group(text, lowered, best_match, group),
+            best_match.group(group + 1), best_match.group(group + 2))
+# Growth rates in priority order
+_GROWTH_RES = [re.compile(p) for p in (
+    r'([+-]?[0-9]+(?:\.[0-9]+)?)\s*%',
+    r'([+-]?[0-9]+(?:\.[0-9]+)?)\s*percent',
+    r'growth:\s*([+-]?[0-9]+(?:\.[0-9]+)?)\s*%'
+)]
+
+def _extract_financial_data(company):
+    """Extract revenue and growth data from company text"""
+    financial_data = {}
+    
+    # Get all text sources
+    raw_text = company.get('raw_text', '')
+    context_line = company.get('context_line', '')
+    company_name = company.get('company_name', '')
+    reported_revenue = ''
+    if 'reported_revenue' in company:
+        reported_revenue = f"Reported Revenue: {company['reported_revenue']}"
+    
+    combined_text = f"{raw_text} {context_line} {company_name} {reported_revenue}"
+    # Every revenue pattern needs '$' or 'revenue' and every growth pattern needs '%' or
+    # 'percent', so rows with neither skip the regex engine entirely
+    lowered = combined_text.lower()
+    
+    # Extract revenue (prioritize "Reported Revenue" over "Revenue Estimate")
+    match = None
+    if '$' in combined_text or 'revenue' in lowered:
+        match = _search_revenue(combined_text, lowered)
+    if match:
+        revenue_raw, amount, unit = match
+        amount = float(amount.replace(',', ''))
+        
+        # Convert to millions; every unit alternative is bil/billion/b or mil/million/m
+        if unit[0] == 'b':
+            revenue_millions = amount * 1000
+        else:  # mil, million, m
+            revenue_millions = amount
+            
+        financial_data['revenue_millions'] = revenue_millions
+        financial_data['revenue_raw'] = revenue_raw
+    
+    # Extract growth rate
+    if '%' in combined_text or 'percent' in lowered:
+        for pattern in _GROWTH_RES:
+            match = pattern.search(lowered)
+            if match:
+                growth_rate = float(match.group(1))
+                financial_data['growth_rate'] = growth_rate
+                financial_data['growth_raw'] = _original_group(combined_text, lowered, match, 0)
+                break
+    
+    return financial_data if financial_data else None
+
+# Filtering criteria: revenue above _CRITERIA_REVENUE[i] (millions) and growth above _CRITERIA_GROWTH[i] (%)
+_CRITERIA_REVENUE = (10, 100, 500, 1000, 5000)
+_CRITERIA_GROWTH = (50, 30, 25, 20, 15)
+
+# Common capitalised words that look like tickers in page text
+_FALSE_POSITIVES = frozenset({
+    'AM', 'PM', 'EST', 'PST', 'GMT', 'UTC', 'USD', 'CEO', 'CFO', 'EPS',
+    'Q1', 'Q2', 'Q3', 'Q4', 'THE', 'AND', 'FOR', 'BUT', 'NOT', 'YOU',
+    'ALL', 'CAN', 'HAD', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'DAY', 'GET',
+    'USE', 'MAN', 'NEW', 'NOW', 'WAY', 'MAY', 'SAY', 'SUN', 'MON', 'TUE',
+    'WED', 'THU', 'FRI', 'SAT', 'JAN', 'FEB', 'MAR', 'APR', 'JUN', 'JUL',
+    'AUG', 'SEP', 'OCT', 'NOV', 'DEC', 'TOP', 'END', 'KEY', 'OPEN', 'BMO',
+    'AMC', 'TBD', 'NONE', 'VIEW', 'LIST', 'ONLY', 'ET', 'PT', 'CT', 'MT'
+})
+# Markup and timezone words that look like tickers in calendar innerHTML
+_EW_FALSE_POSITIVES = frozenset({
+    'HTML', 'DIV', 'SPAN', 'CLASS', 'STYLE', 'HREF', 'SRC', 'ALT',
+    'TEXT', 'FONT', 'SIZE', 'COLOR', 'BOLD', 'LINK', 'BUTTON',
+    'FORM', 'INPUT', 'TABLE', 'TBODY', 'THEAD', 'CELL', 'ROW',
+    'AM', 'PM', 'ET', 'PT', 'CT', 'MT', 'EST', 'PST', 'GMT', 'UTC'
+})
+
+# Class/id patterns for company cards: (CSS selector used as the source label, attribute, needle).
+# A 'class~' attribute means a whole class name, like the .stock selector; the rest are substrings
+_DIV_SELECTORS = [
+    ("*[class*='company']", 'class', 'company'),
+    ("*[class*='earnings']", 'class', 'earnings'),
+    ("*[class*='symbol']", 'class', 'symbol'),
+    ("*[class*='ticker']", 'class', 'ticker'),
+    ("*[class*='eps']", 'class', 'eps'),
+    ("*[id*='company']", 'id', 'company'),
+    ("*[id*='earnings']", 'id', 'earnings'),
+    ("*[class*='cal']", 'class', 'cal'),
+    (".stock", 'class~', 'stock'),
+    (".earning", 'class~', 'earning')
+]
+
+def _div_selector_xpath(attr, needle):
+    if attr == 'class~':
+        return f"contains(concat(' ', normalize-space(@class), ' '), ' {needle} ')"
+    return f"contains(@{attr}, '{needle}')"
+
+# Any element matching at least one of the patterns, in document order
+_DIV_XPATH = lxml.etree.XPath(
+    "//*[" + " or ".join(_div_selector_xpath(attr, needle) for _, attr, needle in _DIV_SELECTORS) + "]"
+)
+
+# XPath expressions the extractors evaluate on every page, compiled once at import
+_NON_TEXT_XPATH = lxml.etree.XPath('//script | //style | //noscript | //template')
+_TABLE_XPATH = lxml.etree.XPath('//table')
+_ROW_XPATH = lxml.etree.XPath('.//tr')
+_HEADER_CELL_XPATH = lxml.etree.XPath('.//th')
+_CELL_XPATH = lxml.etree.XPath('.//td')
+_DATA_ATTRIBUTES = ('data-symbol', 'data-company', 'data-ticker', 'data-eps', 'data-earnings')
+_DATA_ATTRIBUTE_XPATHS = {attr: lxml.etree.XPath(f'//*[@{attr}]') for attr in _DATA_ATTRIBUTES}
+# EarningsWhispers calendar grid/list containers: (CSS selector used as the source label, XPath)
+_EW_SELECTORS = tuple((label, lxml.etree.XPath(xpath)) for label, xpath in (
+    ("[id*='showcal']", "//*[contains(@id, 'showcal')]"),
+    ("[class*='showcal']", "//*[contains(@class, 'showcal')]"),
+    ("[id*='calctrl']", "//*[contains(@id, 'calctrl')]"),
+    ("[class*='calendar']", "//*[contains(@class, 'calendar')]"),
+    (".showlist", "//*[contains(concat(' ', normalize-space(@class), ' '), ' showlist ')]"),
+    ("#showcal", "//*[@id='showcal']")
+))
+
+def _div_selector_index(element):
+    """Index of the first selector in _DIV_SELECTORS that an element matches"""
+    for index, (_, attr, needle) in enumerate(_DIV_SELECTORS):
+        if attr == 'class~':
+            if needle in (element.get('class') or '').split():
+                return index
+        elif needle in (element.get(attr) or ''):
+            return index
+    return len(_DIV_SELECTORS)
+
+# Final filter applied to every extracted symbol, whichever strategy produced it
+# Interned so a canonical symbol (see _canon) that hits the set compares by identity
+_SYMBOL_FALSE_POSITIVES = frozenset(map(sys.intern, (
+    'AM', 'PM', 'ET', 'PT', 'CT', 'MT', 'EST', 'PST', 'GMT', 'UTC',
+    'HTML', 'DIV', 'SPAN', 'CLASS', 'STYLE', 'HREF', 'SRC', 'ALT',
+    'TEXT', 'FONT', 'SIZE', 'COLOR', 'BOLD', 'LINK', 'BUTTON',
+    'FORM', 'INPUT', 'TABLE', 'TBODY', 'THEAD', 'CELL', 'ROW',
+    'CEO', 'CFO', 'EPS', 'Q1', 'Q2', 'Q3', 'Q4', 'THE', 'AND',
+    'FOR', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HAD', 'HER', 'WAS',
+    'ONE', 'OUR', 'OUT', 'DAY', 'GET', 'USE', 'MAN', 'NEW', 'NOW',
+    'WAY', 'MAY', 'SAY', 'TOP', 'END', 'KEY', 'OPEN', 'BMO', 'AMC',
+    'TBD', 'NONE', 'VIEW', 'LIST', 'ONLY'
+)))
+
+def _canon(symbol):
+    """
+    Canonical (stripped, upper-case, interned) form of a ticker. Applied once when a symbol
+    enters the pipeline so later stages compare and hash it without re-normalising.
+    """
+    return sys.intern(symbol.strip().upper())
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_symbol(symbol):
+    """
+    Whether a canonical symbol looks like a real ticker: 1-5 ASCII letters and not a known
+    false positive. Tickers repeat across strategies and pages, so results are memoised.
+    """
+    # Plain string checks, no regex engine call
+    return (0 < len(symbol) <= 5 and symbol.isascii() and symbol.isalpha() and symbol.isupper()
+            and symbol not in _SYMBOL_FALSE_POSITIVES)
+
+# Elements Chrome lays out on their own line(s) in innerText
+_BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+    'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tbody', 'tfoot',
+    'thead', 'tr', 'ul'
+})
+_CELL_TAGS = frozenset({'td', 'th'})
+
+def inner_text(element):
+    """
+    Approximate Selenium's element.text for a parsed lxml element: block elements start new
+    lines, table cells are space separated and runs of whitespace collapse to one space.
+    """
+    parts = []
+
+    def walk(el):
+        # Comments and processing instructions have non-string tags and no visible text
+        if not isinstance(el.tag, str):
+            return
+        if el.tag in _BLOCK_TAGS:
+            parts.append('\n')
+        elif el.tag in _CELL_TAGS:
+            parts.append(' ')
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if el.tag in _BLOCK_TAGS:
+            parts.append('\n')
+
+    walk(element)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+def element_inner_html(element):
+    """Equivalent of the DOM innerHTML property for a parsed lxml element"""
+    return (element.text or '') + ''.join(
+        lxml.html.tostring(child, encoding='unicode') for child in element
+    )
+
+@functools.lru_cache(maxsize=1)
+def _find_chromedriver_path():
+    """
+    Find the ChromeDriver executable in webdriver-manager cache.
+    Cached for the life of the process, so pooled browsers don't each re-glob the cache.
+    """
+    wdm_path = os.path.expanduser("~/.wdm/drivers/chromedriver/mac64/*/chromedriver-mac-arm64/chromedriver")
+    
+    def version_key(path):
+        # The version directory sits two levels above the binary; compare it numerically so
+        # that e.g. 120.x sorts after 99.x
+        version = path.split(os.sep)[-3]
+        return tuple(int(part) if part.isdigit() else 0 for part in version.split('.'))
+    
+    # Take the latest version, without materialising the whole glob
+    latest = max(glob.iglob(wdm_path), key=version_key, default=None)
+    if latest is not None:
+        return latest
+    
+    # Fallback paths
+    fallback_paths = [
+        "/usr/local/bin/chromedriver",
+        "/opt/homebrew/bin/chromedriver",
+        "chromedriver"  # If in PATH
+    ]
+    
+    for path in fallback_paths:
+        if os.path.exists(path) or path == "chromedriver":
+            return path
+            
+    raise Exception("ChromeDriver not found. Please check installation.")
+
+@functools.lru_cache(maxsize=1)
+def _read_tracking_list(tracking_file, mtime_ns):
+    """
+    Parse a tracking list file into a set of symbols. Keyed on the file's mtime, so every
+    scraper in the process shares one parse until the file is edited.
+    """
+    with open(tracking_file, 'r', encoding='utf-8') as f:
+        lines = f.read().upper().splitlines()
+    # Skip empty lines and comments; interned like the symbols _canon produces
+    return frozenset(
+        sys.intern(line) for line in map(str.strip, lines) if line and not line.startswith('#')
+    )
+
+class BrowserPool:
+    """
+    Headless Chrome instances shared across scrapes, so Chrome startup is paid once per browser
+    rather than once per date. Browsers are launched lazily up to `size` and relaunched after
+    `max_uses` scrapes to bound memory drift.
+    """
+    
+    def __init__(self, size=4, max_uses=50, headless=True, debug=False):
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self.debug = debug
+        self._lock = threading.Lock()
+        self._closed = False
+        # Holds idle drivers, plus one None token for every browser that may still be launched
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(None)
+    
+    def warm(self):
+        """Launch every browser up front so the first scrapes don't pay Chrome startup"""
+        items = []
+        while True:
+            try:
+                items.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            for i, item in enumerate(items):
+                if item is None:
+                    items[i] = self._launch()
+        finally:
+            for item in items:
+                self._idle.put(item)
+    
+    @contextmanager
+    def acquire(self):
+        """Check a driver out of the pool; it is discarded instead of reused if the block raises"""
+        driver = self._checkout()
+        healthy = False
+        try:
+            yield driver
+            healthy = True
+        finally:
+            self._release(driver, healthy)
+    
+    def close(self):
+        """Quit every idle browser; browsers still checked out are quit when released"""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if driver is not None:
+                self._quit(driver)
+    
+    def _launch(self):
+        launcher = EarningsSeleniumScraper(headless=self.headless, debug=self.debug, selenium_fallback=False)
+        try:
+            driver = launcher.create_driver(self.headless)
+        finally:
+            launcher.flush_debug()
+        driver.pool_uses = 0
+        return driver
+    
+    def _checkout(self):
+        driver = self._idle.get()
+        if driver is not None and not self._session_alive(driver):
+            print("Pooled browser lost its WebDriver session, relaunching it")
+            self._quit(driver)
+            driver = None
+        if driver is None:
+            try:
+                driver = self._launch()
+            except Exception:
+                # Give the slot back so another caller can retry the launch
+                self._idle.put(None)
+                raise
+        return driver
+    
+    def _release(self, driver, healthy):
+        driver.pool_uses += 1
+        with self._lock:
+            closed = self._closed
+        if healthy and not closed and driver.pool_uses < self.max_uses:
+            try:
+                # Clear per-scrape state over CDP, keeping the Chrome process and its warm JS VM
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                # The consent cookie went with the rest, so the next scrape seeds it again
+                driver.cookies_seeded = False
+                self._idle.put(driver)
+                return
+            except Exception as e:
+                print(f"Pooled browser failed to reset, discarding it: {e}")
+        self._quit(driver)
+        self._idle.put(None)
+    
+    @staticmethod
+    def _session_alive(driver):
+        """Round-trip a trivial script, so a browser that crashed while idle is caught before reuse"""
+        try:
+            return driver.execute_script("return 1") == 1
+        except WebDriverException:
+            return False
+    
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error closing pooled browser: {e}")
 
 class EarningsSeleniumScraper:
-    def __init__(self, headless=True, debug=False):
+    def __init__(self, headless=True, debug=False, selenium_fallback=True, pool=None, timer=None):
+        self.headless = headless
         self.debug = debug
+        # Optional context-manager factory wrapped around the 'navigate' and 'parse' phases, e.g.
+        # the scheduler's _timed, so callers can attribute latency within a scrape
+        self.timer = timer
         self.tabs_opened = False
-        self.setup_driver(headless)
+        self.selenium_fallback = selenium_fallback
+        self.pool = pool
+        self.driver = None
+        # page_source of the page currently loaded, read at most once per load (see snapshot_page_source)
+        self._cached_page_source = None
+        self._debug_buf = []
+        # With a pool, a driver is checked out per scrape instead of owned by this scraper
+        if selenium_fallback and pool is None:
+            self.setup_driver(headless)
         
+    def timed(self, phase):
+        """Wrap one phase of a scrape in the timer, if one was given"""
+        return self.timer(phase) if self.timer is not None else nullcontext()
+    
     def find_chromedriver_path(self):
         """Find the ChromeDriver executable in webdriver-manager cache"""
-        wdm_path = os.path.expanduser("~/.wdm/drivers/chromedriver/mac64/*/chromedriver-mac-arm64/chromedriver")
-        chromedriver_paths = glob.glob(wdm_path)
-        
-        if chromedriver_paths:
-            # Sort by version and get the latest
-            latest_path = sorted(chromedriver_paths)[-1]
-            self.debug_print(f"Found ChromeDriver at: {latest_path}")
-            return latest_path
-        
-        # Fallback paths
-        fallback_paths = [
-            "/usr/local/bin/chromedriver",
-            "/opt/homebrew/bin/chromedriver",
-            "chromedriver"  # If in PATH
-        ]
-        
-        for path in fallback_paths:
-            if os.path.exists(path) or path == "chromedriver":
-                self.debug_print(f"Using fallback ChromeDriver: {path}")
-                return path
-                
-        raise Exception("ChromeDriver not found. Please check installation.")
+        path = _find_chromedriver_path()
+        self.debug_print(f"Using ChromeDriver at: {path}")
+        return path
         
     def setup_driver(self, headless):
         """Setup Chrome WebDriver with appropriate options"""
+        self.bind_driver(self.create_driver(headless))
+    
+    def bind_driver(self, driver):
+        """Point this scraper at a driver (its own, or one checked out of a pool)"""
+        self.driver = driver
+        # No blind sleeps remain before these waits, so 10 s is ample for the page to arrive
+        self.wait = WebDriverWait(driver, 10)
+        # For steps that normally finish in well under a second, so a broken selector costs 5 s, not 30
+        self.short_wait = WebDriverWait(driver, 5)
+    
+    def create_driver(self, headless):
+        """Launch a Chrome WebDriver with the scraping options"""
         chrome_options = Options()
         if headless:
-            chrome_options.add_argument('--headless')
+            # The new headless mode renders like headed Chrome, avoiding old-headless slow paths
+            chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+        # Don't advertise automation; bot checks on the cookie wall otherwise slow the page down
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option("useAutomationExtension", False)
+        
+        # Trim per-instance memory so more browsers fit in the scheduler's pool
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-features=Translate')
+        chrome_options.add_argument('--metrics-recording-only')
+        chrome_options.add_argument('--no-first-run')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_argument('--js-flags=--max-old-space-size=256')
+        chrome_options.add_argument('--renderer-process-limit=1')
+        # Pages are fetched once per scrape, so an on-disk HTTP cache is only write overhead
+        chrome_options.add_argument('--disk-cache-size=0')
+        
+        # Headless tabs count as backgrounded; keep their timers and renderer at full speed
+        chrome_options.add_argument('--disable-background-timer-throttling')
+        chrome_options.add_argument('--disable-renderer-backgrounding')
+        
+        # The calendar is text-only, so don't download or decode images
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        
+        # Return from driver.get() at DOMContentLoaded instead of the full load event; the
+        # calendar is waited for explicitly (wait_for_calendar_data), not via page load
+        chrome_options.page_load_strategy = 'eager'
         
         try:
             # Find ChromeDriver path manually
@@ -66,10 +730,18 @@ class EarningsSeleniumScraper:
             
             # Create service with explicit path
             service = Service(chromedriver_path)
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 30)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Lookups for absent elements (the cookie-button probes) must fail fast; every wait
+            # that should poll is an explicit WebDriverWait
+            driver.implicitly_wait(0)
+            
+            # Never fetch images, fonts or trackers; the extractors only read text. The block
+            # list lives on the DevTools session, so every later page load inherits it
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
             
             self.debug_print(f"Successfully initialized ChromeDriver from: {chromedriver_path}")
+            return driver
             
         except Exception as e:
             print(f"Error setting up Chrome driver: {e}")
@@ -77,17 +749,106 @@ class EarningsSeleniumScraper:
             raise
     
     def debug_print(self, message):
-        """Print debug messages if debug mode is enabled"""
+        """Buffer debug messages if debug mode is enabled; they are written out in batches"""
         if self.debug:
-            print(f"[DEBUG] {message}")
+            self._debug_buf.append(f"[DEBUG] {message}")
+            if len(self._debug_buf) >= DEBUG_FLUSH_LINES:
+                self.flush_debug()
+    
+    def flush_debug(self):
+        """Write out buffered debug messages with a single write"""
+        if self._debug_buf:
+            sys.stdout.write('\n'.join(self._debug_buf) + '\n')
+            self._debug_buf.clear()
     
-    def scrape_calendar(self, date_str):
+    def scrape_calendar(self, date_str, force_refresh=False):
         """
         Scrape earnings calendar for a specific date
         date_str format: YYYYMMDD (e.g., '20250714')
+        force_refresh: ignore a calendar already cached and fetch it again
+        """
+        url = self.calendar_url(date_str)
+        
+        try:
+            earnings_data = None
+            if not force_refresh:
+                # Finished dates never change, so their extracted calendar is reused as-is
+                earnings_data = _load_cached_result(url, date_str)
+                if earnings_data is not None:
+                    self.debug_print(f"Using cached calendar for {date_str}")
+                    self.save_filtered_companies(earnings_data, date_str)
+                    return earnings_data
+            
+            # Fast path: if the server already rendered the calendar, skip the browser entirely
+            with self.timed("navigate"):
+                html = fetch_calendar_html(url)
+            earnings_data = self.scrape_fetched(url, date_str, html)
+            
+            _store_cached_result(url, date_str, earnings_data)
+            return earnings_data
+        finally:
+            self.flush_debug()
+    
+    def scrape_many(self, dates, workers=4, force_refresh=False):
+        """
+        Scrape several dates concurrently; returns {date_str: earnings data or None}.
+        Uncached dates are fetched in one async HTTP batch, and pages that still need Chrome are
+        rendered on `workers` threads sharing a browser pool (this scraper's, or a temporary one).
         """
+        urls = {date_str: self.calendar_url(date_str) for date_str in dates}
+        results = {}
+        
+        pending = []
+        for date_str in dates:
+            earnings_data = None
+            if not force_refresh:
+                earnings_data = _load_cached_result(urls[date_str], date_str)
+            if earnings_data is not None:
+                self.save_filtered_companies(earnings_data, date_str)
+                results[date_str] = earnings_data
+            else:
+                pending.append(date_str)
+        
+        if pending:
+            with self.timed("navigate"):
+                pages = asyncio.run(fetch_calendar_html_many([urls[date_str] for date_str in pending]))
+            
+            pool = self.pool
+            own_pool = pool is None and self.selenium_fallback
+            if own_pool:
+                pool = BrowserPool(size=workers, headless=self.headless, debug=self.debug)
+            
+            def scrape_page(date_str, html):
+                # Scrapers bind a checked-out driver per scrape, so each thread needs its own
+                scraper = EarningsSeleniumScraper(headless=self.headless, debug=self.debug,
+                                                  selenium_fallback=self.selenium_fallback, pool=pool,
+                                                  timer=self.timer)
+                try:
+                    return scraper.scrape_fetched(urls[date_str], date_str, html)
+                finally:
+                    scraper.flush_debug()
+            
+            try:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scrape') as executor:
+                    futures = {
+                        date_str: executor.submit(scrape_page, date_str, html)
+                        for date_str, html in zip(pending, pages)
+                    }
+                    for date_str, future in futures.items():
+                        results[date_str] = future.result()
+            finally:
+                if own_pool:
+                    pool.close()
+        
+        for date_str in pending:
+            _store_cached_result(urls[date_str], date_str, results[date_str])
+        
+        self.flush_debug()
+        return {date_str: results[date_str] for date_str in dates}
+    
+    def calendar_url(self, date_str):
+        """Calendar URL for a date, picking the pre- or post-market view from the current Eastern Time"""
         # Determine the time suffix based on Eastern Time
-        from datetime import datetime
         import pytz
         
         # Get current time in Eastern Time
@@ -97,36 +858,95 @@ class EarningsSeleniumScraper:
         # If before 4 PM ET, use suffix 1; if after 4 PM ET, use suffix 2
         time_suffix = "1" if now_eastern.hour < 16 else "2"
         
-        url = f"https://www.earningswhispers.com/calendar/{date_str}/{time_suffix}"
         print(f"Scraping earnings calendar for {date_str} (Eastern Time: {now_eastern.strftime('%H:%M %Z')}, suffix: {time_suffix})")
+        return f"https://www.earningswhispers.com/calendar/{date_str}/{time_suffix}"
+    
+    def scrape_fetched(self, url, date_str, html):
+        """Extract a page fetched over HTTP (None if the fetch failed), falling back to Selenium if allowed"""
+        if html is not None:
+            with self.timed("parse"):
+                earnings_data = self.extract_earnings_data_from_html(date_str, html, require_structured=True)
+            if earnings_data['status'] == 'success' or not self.selenium_fallback:
+                return earnings_data
+            self.debug_print("No rendered calendar in the HTTP response (JS-gated page), falling back to Selenium")
+        elif not self.selenium_fallback:
+            return None
         
         try:
+            if self.pool is None:
+                return self.scrape_with_browser(url, date_str)
+            # A driver that raised mid-scrape is quit by the pool rather than handed out again
+            with self.pool.acquire() as driver:
+                self.bind_driver(driver)
+                try:
+                    return self.scrape_with_browser(url, date_str)
+                finally:
+                    self.driver = None
+            
+        except Exception as e:
+            print(f"Error scraping calendar: {e}")
+            return None
+    
+    def scrape_with_browser(self, url, date_str):
+        """Render the calendar in Chrome and extract it; errors propagate to the caller"""
+        with self.timed("navigate"):
+            # Seed the consent cookie first so the cookie wall normally never appears
+            if not getattr(self.driver, 'cookies_seeded', False):
+                self.seed_cookies()
+            
             # Navigate to the page
             self.debug_print(f"Navigating to {url}")
             self.driver.get(url)
+            self._cached_page_source = None
             
-            # Handle cookie acceptance
-            self.handle_cookie_wall()
+            # Handle cookie acceptance, only if the seeded cookies didn't get us past it
+            handled_cookie_wall = self._cookie_wall_present()
+            if handled_cookie_wall:
+                self.handle_cookie_wall()
             
             # Wait for the page to load and JavaScript to execute
             self.debug_print("Waiting for calendar data to load...")
             self.wait_for_calendar_data()
-            
-            # Extract earnings data
-            earnings_data = self.extract_earnings_data(date_str)
-            
-            return earnings_data
-            
-        except Exception as e:
-            print(f"Error scraping calendar: {e}")
-            return None
+        
+        # Remember the cookies that got us through the wall for later sessions
+        if handled_cookie_wall and not self._cookie_wall_present():
+            _save_cookie_jar(self.driver.get_cookies())
+        
+        # Extract earnings data from one snapshot of the page source and visible text (reusing the
+        # debug check's snapshot if it took one); the snapshot is dropped once read. innerText is
+        # read from the browser because only it applies CSS, so hidden text stays out of extraction
+        html = self.snapshot_page_source()
+        self._cached_page_source = None
+        body_text = self.driver.execute_script("return document.body.innerText")
+        with self.timed("parse"):
+            earnings_data = self.extract_earnings_data(date_str, html, body_text)
+        return earnings_data
+    
+    def snapshot_page_source(self):
+        """
+        The loaded page's HTML. Each driver.page_source read serialises the whole DOM over
+        chromedriver, so it is read once and reused until the page navigates or reloads.
+        """
+        if self._cached_page_source is None:
+            self._cached_page_source = self.driver.page_source
+        return self._cached_page_source
+    
+    def seed_cookies(self):
+        """Add the consent cookie, plus any cookies saved by earlier sessions, to the browser"""
+        # Set over DevTools rather than add_cookie(), which only works for the domain currently
+        # loaded and so would cost a homepage visit before the first real page load
+        for cookie in [CONSENT_COOKIE] + _load_cookie_jar():
+            try:
+                self.driver.execute_cdp_cmd("Network.setCookie", _cdp_cookie(cookie))
+            except Exception as e:
+                self.debug_print(f"Could not restore cookie {cookie.get('name')}: {e}")
+        self.driver.cookies_seeded = True
     
     def handle_cookie_wall(self):
         """Handle the specific cookie acceptance mechanism used by EarningsWhispers"""
+        # Accepting reloads the page, so any snapshot taken before is stale
+        self._cached_page_source = None
         try:
-            # Wait a moment for the page to load
-            time.sleep(3)
-            
             # Strategy 1: Look for the generic cookie consent banner first
             generic_cookie_selectors = [
                 "button[data-cookie-string]",
@@ -141,8 +961,8 @@ class EarningsSeleniumScraper:
                         if element.is_displayed() and element.is_enabled():
                             self.debug_print(f"Found and clicking generic cookie button: {selector}")
                             element.click()
-                            time.sleep(2)
                             # Page will reload after cookie acceptance
+                            self._wait_for_cookie_wall_gone()
                             return
                 except Exception as e:
                     self.debug_print(f"Generic cookie selector {selector} failed: {e}")
@@ -167,9 +987,8 @@ class EarningsSeleniumScraper:
                         if element.is_displayed() and element.is_enabled():
                             self.debug_print(f"Found and clicking main cookie button: {selector}")
                             element.click()
-                            time.sleep(3)
                             # Wait for page to reload/refresh
-                            self.wait.until(lambda driver: "Accept Cookies" not in driver.page_source)
+                            self._wait_for_cookie_wall_gone()
                             return
                 except Exception as e:
                     self.debug_print(f"Main cookie selector {selector} failed: {e}")
@@ -203,7 +1022,7 @@ class EarningsSeleniumScraper:
                 
                 if result:
                     self.debug_print(f"JavaScript cookie acceptance result: {result}")
-                    time.sleep(5)  # Wait for page reload
+                    self._wait_for_cookie_wall_gone()  # Wait for page reload
                     return
                     
             except Exception as e:
@@ -214,6 +1033,21 @@ class EarningsSeleniumScraper:
         except Exception as e:
             self.debug_print(f"Cookie handling error: {e}")
     
+    def _cookie_wall_present(self):
+        """Ask the page itself whether the cookie wall is up, instead of pulling page_source over the wire"""
+        return self.driver.execute_script(_COOKIE_WALL_JS)
+    
+    def _wait_for_cookie_wall_gone(self):
+        """Poll until the reloaded page no longer shows the cookie wall, instead of sleeping"""
+        try:
+            # Scripts can fail while the old document is being torn down; keep polling through that
+            WebDriverWait(self.driver, COOKIE_WALL_TIMEOUT, poll_frequency=0.25,
+                          ignored_exceptions=(WebDriverException,)).until(
+                lambda driver: not self._cookie_wall_present()
+            )
+        except TimeoutException:
+            self.debug_print("Cookie wall still present after accepting cookies")
+    
     def wait_for_calendar_data(self):
         """Wait for the calendar data to load via JavaScript"""
         try:
@@ -222,20 +1056,22 @@ class EarningsSeleniumScraper:
             self.debug_print(f"Page title confirmed: {self.driver.title}")
             
             # Wait for body content to load
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            self.short_wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             
             # Check if we still see cookie wall
-            if "Accept Cookies" in self.driver.page_source:
+            if self._cookie_wall_present():
                 self.debug_print("Still seeing cookie wall, attempting additional handling...")
                 self.handle_cookie_wall()
-                time.sleep(3)
             
-            # Give JavaScript time to execute and load data
+            # Poll until the calendar has rendered rather than sleeping for a fixed worst case
             self.debug_print("Waiting for JavaScript to execute and load earnings data...")
-            time.sleep(15)  # Increased wait time for data loading
+            WebDriverWait(self.driver, CALENDAR_READY_TIMEOUT, poll_frequency=0.25).until(
+                lambda driver: driver.execute_script(_CALENDAR_READY_JS)
+            )
             
-            # Check if calendar data has loaded
-            self.check_calendar_loaded()
+            # Check if calendar data has loaded (diagnostics only, each check is a chromedriver round-trip)
+            if self.debug:
+                self.check_calendar_loaded()
             
         except TimeoutException as e:
             self.debug_print(f"Timeout waiting for calendar data: {e}")
@@ -245,12 +1081,15 @@ class EarningsSeleniumScraper:
     def check_calendar_loaded(self):
         """Check if calendar data has actually loaded"""
         try:
+            # Shared with the extraction that follows, so debug runs still read page_source once
+            page_source = self.snapshot_page_source()
+            
             # Get page source length
-            page_length = len(self.driver.page_source)
+            page_length = len(page_source)
             self.debug_print(f"Page source length: {page_length}")
             
             # Check if cookie wall is still present
-            has_cookie_wall = "Accept Cookies" in self.driver.page_source
+            has_cookie_wall = "Accept Cookies" in page_source
             self.debug_print(f"Cookie wall present: {has_cookie_wall}")
             
             # Look for specific calendar-related content
@@ -264,7 +1103,7 @@ class EarningsSeleniumScraper:
                 "symbol"
             ]
             
-            page_source = self.driver.page_source.lower()
+            page_source = page_source.lower()
             found_indicators = [ind for ind in calendar_indicators if ind in page_source]
             self.debug_print(f"Found calendar indicators: {found_indicators}")
             
@@ -290,8 +1129,27 @@ class EarningsSeleniumScraper:
         except Exception as e:
             self.debug_print(f"Error checking calendar loaded: {e}")
     
-    def extract_earnings_data(self, date_str):
-        """Extract earnings data from the loaded page"""
+    def extract_earnings_data(self, date_str, html, body_text=None):
+        """Extract earnings data from the loaded page's source and innerText; parsing runs in-process on lxml"""
+        earnings_data = self.extract_earnings_data_from_html(date_str, html, body_text)
+        
+        # Save page source for debugging; it can run to megabytes, so only when asked for
+        if self.debug and os.getenv('EW_DUMP_HTML'):
+            with open('debug_selenium_final_page.html', 'wb') as f:
+                f.write(html.encode('utf-8'))
+            self.debug_print("Saved page source to debug_selenium_final_page.html")
+            
+        return earnings_data
+    
+    def extract_earnings_data_from_html(self, date_str, html, body_text=None, require_structured=False):
+        """
+        Extract earnings data from calendar HTML (rendered by Chrome or fetched over HTTP).
+        body_text is the page's visible text if the caller already has it; otherwise it is derived
+        from the HTML when the text strategy needs it.
+        require_structured: report status 'not_rendered' unless MIN_TABLE_COMPANIES table rows, a data
+        attribute or a JSON symbol show the calendar is in the HTML, since the noisier strategies
+        (and the sidebar table) also match the unrendered page shell
+        """
         earnings_data = {
             'date': date_str,
             'scraped_at': datetime.now().isoformat(),
@@ -301,84 +1159,58 @@ class EarningsSeleniumScraper:
         
         try:
             # Check if we still have cookie wall
-            if "Accept Cookies" in self.driver.page_source:
+            if "Accept Cookies" in html:
                 earnings_data['status'] = 'cookie_wall_present'
                 earnings_data['message'] = 'Cookie acceptance required but not completed'
                 return earnings_data
-            
-            # Try multiple strategies to find earnings data
-            companies = []
-            
+                
+            tree = lxml.html.fromstring(html)
+            # Script and style bodies aren't part of the visible text the extractors expect
+            for element in _NON_TEXT_XPATH(tree):
+                element.drop_tree()
+                
+            # Try multiple strategies to find earnings data. Each is a generator, so records
+            # stream straight into the sink, which keeps only the richest one for every symbol
+            sink = {}
             # Strategy 1: Look for tables
-            companies.extend(self.extract_from_tables())
-            
-            # Strategy 2: Look for specific class patterns
-            companies.extend(self.extract_from_divs())
-            
-            # Strategy 3: Look for data attributes
-            companies.extend(self.extract_from_data_attributes())
-            
-            # Strategy 4: Look for specific patterns in text
-            companies.extend(self.extract_from_text_patterns())
-            
-            # Strategy 5: Look in page source for structured data
-            companies.extend(self.extract_from_page_source())
-            
-            # Strategy 6: Look for specific EarningsWhispers content patterns
-            companies.extend(self.extract_from_ew_patterns())
-            
-            # Remove duplicates and clean data
-            companies = self.deduplicate_companies(companies)
-            
-            earnings_data['companies'] = companies
-            
-            if len(companies) == 0:
-                earnings_data['status'] = 'no_data_found'
-                earnings_data['message'] = f'No earnings data found for {date_str}. This might be a future date with no scheduled earnings.'
-            
-            self.debug_print(f"Total companies found: {len(companies)}")
-            
-            # Apply filtering criteria and save filtered results
-            if companies:
-                # Load tracking list
-                tracking_list = self.load_tracking_list()
-                filtered_companies = self.filter_companies_by_criteria(companies, tracking_list)
-                if filtered_companies:
-                    filtered_data = {
-                        'date': date_str,
-                        'scraped_at': datetime.now().isoformat(),
-                        'filter_criteria': {
-                            'revenue_growth_rules': [
-                                '>10M revenue and >50% growth',
-                                '>100M revenue and >30% growth',
-                                '>500M revenue and >25% growth', 
-                                '>1000M revenue and >20% growth',
-                                '>5000M revenue and >15% growth'
-                            ],
-                            'tracking_list': sorted(list(tracking_list)) if tracking_list else [],
-                            'tracking_list_count': len(tracking_list) if tracking_list else 0
-                        },
-                        'companies': filtered_companies,
-                        'total_filtered': len(filtered_companies),
-                        'total_original': len(companies)
-                    }
-                    
-                    # Save filtered results with timestamp
-                    timestamp = datetime.now().strftime("%H%M")
-                    filtered_filename = f"earnings_filtered_{date_str}_{timestamp}.json"
-                    self.save_to_file(filtered_data, filtered_filename)
-                    self.debug_print(f"Saved {len(filtered_companies)} filtered companies to {filtered_filename}")
-                    
-                    # Print SeekingAlpha URLs for filtered companies
-                    self.print_seeking_alpha_urls(filtered_companies)
+            for company in self.extract_from_tables(tree):
+                self.add_company(sink, company)
+            # Once the tables gave a calendar's worth of rows, the noisier fallbacks (class patterns,
+            # free text, EW containers) only add duplicates and false positives, so they are skipped
+            fallbacks = len(sink) < MIN_TABLE_COMPANIES
+            # Whether the calendar itself is in the HTML: tables only count with a calendar's worth
+            # of rows, since the unrendered page shell carries a small sidebar quote table
+            structured = not fallbacks
+            if fallbacks and body_text is None:
+                body = tree.find('body')
+                body_text = inner_text(body if body is not None else tree)
+            
+            # Each strategy is paired with whether its records are structured evidence; they
+            # still run in this order, so the first record keeps winning score ties
+            strategies = (
+                # Strategy 2: Look for specific class patterns
+                (self.extract_from_divs(tree) if fallbacks else (), False),
+                # Strategy 3: Look for data attributes
+                (self.extract_from_data_attributes(tree), True),
+                # Strategy 4: Look for specific patterns in text
+                (self.extract_from_text_patterns(body_text) if fallbacks else (), False),
+                # Strategy 5: Look in page source for structured data
+                (self.extract_from_page_source(html), True),
+                # Strategy 6: Look for specific EarningsWhispers content patterns
+                (self.extract_from_ew_patterns(tree) if fallbacks else (), False)
+            )
+            for records, is_structured in strategies:
+                for company in records:
+                    if self.add_company(sink, company) and is_structured:
+                        structured = True
+            
+            if require_structured and not structured:
+                self.debug_print("No table rows, data attributes or JSON symbols: calendar not rendered")
+                earnings_data['status'] = 'not_rendered'
+                earnings_data['message'] = 'The page has no rendered calendar rows'
+                return earnings_data
             
-            # Save page source for debugging
-            if self.debug:
-                with open('debug_selenium_final_page.html', 'w', encoding='utf-8') as f:
-                    f.write(self.driver.page_source)
-                self.debug_print("Saved page source to debug_selenium_final_page.html")
-            
-            return earnings_data
+            return self.finalize_earnings_data(earnings_data, sink, date_str)
             
         except Exception as e:
             self.debug_print(f"Error extracting earnings data: {e}")
@@ -386,131 +1218,171 @@ class EarningsSeleniumScraper:
             earnings_data['message'] = str(e)
             return earnings_data
     
-    def extract_from_tables(self):
+    def finalize_earnings_data(self, earnings_data, sink, date_str):
+        """Clean the best record for each symbol, then filter and save the ones worth following up"""
+        # Clean the deduplicated records
+        companies = self.clean_companies(sink)
+        
+        earnings_data['companies'] = companies
+        
+        if len(companies) == 0:
+            earnings_data['status'] = 'no_data_found'
+            earnings_data['message'] = f'No earnings data found for {date_str}. This might be a future date with no scheduled earnings.'
+        
+        self.debug_print(f"Total companies found: {len(companies)}")
+        
+        self.save_filtered_companies(earnings_data, date_str)
+        return earnings_data
+    
+    def save_filtered_companies(self, earnings_data, date_str):
+        """
+        Filter an extraction's companies against the criteria and tracking list, then save and print
+        the ones worth following up. Runs on result-cache hits too, since the cache holds the
+        extraction before filtering and the tracking list may have changed since.
+        """
+        companies = earnings_data['companies']
+        
+        # Apply filtering criteria and save filtered results
+        if companies:
+            # Load tracking list
+            tracking_list = self.load_tracking_list()
+            filtered_companies = self.filter_companies_by_criteria(companies, tracking_list)
+            if filtered_companies:
+                filtered_data = {
+                    'date': date_str,
+                    'scraped_at': earnings_data['scraped_at'],
+                    'filter_criteria': {
+                        'revenue_growth_rules': [
+                            '>10M revenue and >50% growth',
+                            '>100M revenue and >30% growth',
+                            '>500M revenue and >25% growth', 
+                            '>1000M revenue and >20% growth',
+                            '>5000M revenue and >15% growth'
+                        ],
+                        'tracking_list': sorted(list(tracking_list)) if tracking_list else [],
+                        'tracking_list_count': len(tracking_list) if tracking_list else 0
+                    },
+                    'companies': filtered_companies,
+                    'total_filtered': len(filtered_companies),
+                    'total_original': len(companies)
+                }
+                
+                # Save filtered results with timestamp
+                timestamp = datetime.now().strftime("%H%M")
+                filtered_filename = f"earnings_filtered_{date_str}_{timestamp}.json"
+                self.save_to_file(filtered_data, filtered_filename)
+                self.debug_print(f"Saved {len(filtered_companies)} filtered companies to {filtered_filename}")
+                
+                # Print SeekingAlpha URLs for filtered companies
+                self.print_seeking_alpha_urls(filtered_companies)
+    
+    def extract_from_tables(self, tree):
         """Extract data from HTML tables"""
-        companies = []
         try:
-            tables = self.driver.find_elements(By.TAG_NAME, "table")
+            tables = _TABLE_XPATH(tree)
             self.debug_print(f"Found {len(tables)} tables")
             
             for i, table in enumerate(tables):
-                self.debug_print(f"Processing table {i+1}")
+                if self.debug:
+                    self.debug_print(f"Processing table {i+1}")
                 try:
-                    rows = table.find_elements(By.TAG_NAME, "tr")
-                    self.debug_print(f"Table {i+1} has {len(rows)} rows")
-                    
-                    # Find header row to identify "Reported Revenue" column
-                    header_row = None
-                    reported_revenue_col = -1
+                    rows = _ROW_XPATH(table)
+                    if self.debug:
+                        self.debug_print(f"Table {i+1} has {len(rows)} rows")
                     
+                    header_texts = []
                     if len(rows) > 0:
-                        header_cells = rows[0].find_elements(By.TAG_NAME, "th")
+                        header_cells = _HEADER_CELL_XPATH(rows[0])
                         if not header_cells:  # Try td if no th elements
-                            header_cells = rows[0].find_elements(By.TAG_NAME, "td")
-                        
-                        for col_idx, header_cell in enumerate(header_cells):
-                            header_text = header_cell.text.strip().lower()
-                            if 'reported revenue' in header_text and 'estimate' not in header_text:
-                                reported_revenue_col = col_idx
-                                self.debug_print(f"Found 'Reported Revenue' column at index {col_idx}")
-                                break
+                            header_cells = _CELL_XPATH(rows[0])
+                        header_texts = [inner_text(cell) for cell in header_cells]
                     
-                    for j, row in enumerate(rows[1:]):  # Skip header
-                        cells = row.find_elements(By.TAG_NAME, "td")
-                        if len(cells) >= 2:
-                            company_data = {}
-                            
-                            # Extract text from cells
-                            for k, cell in enumerate(cells):
-                                text = cell.text.strip()
-                                if k == 0 and text and re.match(r'^[A-Z]{1,5}$', text):
-                                    company_data['symbol'] = text
-                                elif k == 1 and text:
-                                    company_data['company_name'] = text
-                                elif k == reported_revenue_col and text and reported_revenue_col > -1:
-                                    # This is the reported revenue column
-                                    company_data['reported_revenue'] = text
-                                elif k > 1 and text:
-                                    company_data[f'cell_{k}'] = text
-                            
-                            if company_data:
-                                company_data['source'] = f'table_{i+1}_row_{j+1}'
-                                companies.append(company_data)
-                                self.debug_print(f"Found company from table: {company_data}")
+                    body_rows = [
+                        [inner_text(cell) for cell in _CELL_XPATH(row)]
+                        for row in rows[1:]  # Skip header
+                    ]
+                    yield from self.parse_table_rows(i, header_texts, body_rows)
                                 
                 except Exception as e:
                     self.debug_print(f"Error processing table {i+1}: {e}")
                     
         except Exception as e:
             self.debug_print(f"Error extracting from tables: {e}")
+    
+    def parse_table_rows(self, table_index, header_texts, body_rows):
+        """Turn one table's header texts and row cell texts into company records"""
+        # Find header row to identify "Reported Revenue" column
+        reported_revenue_col = -1
+        for col_idx, header_text in enumerate(header_texts):
+            header_text = header_text.strip().lower()
+            if 'reported revenue' in header_text and 'estimate' not in header_text:
+                reported_revenue_col = col_idx
+                self.debug_print(f"Found 'Reported Revenue' column at index {col_idx}")
+                break
         
-        return companies
+        for j, cells in enumerate(body_rows):
+            if len(cells) >= 2:
+                company_data = {}
+                
+                # Extract text from cells
+                for k, text in enumerate(cells):
+                    if k == 0 and text and _SYMBOL_RE.match(text):
+                        company_data['symbol'] = text
+                    elif k == 1 and text:
+                        company_data['company_name'] = text
+                    elif k == reported_revenue_col and text and reported_revenue_col > -1:
+                        # This is the reported revenue column
+                        company_data['reported_revenue'] = text
+                    elif k > 1 and text:
+                        company_data[f'cell_{k}'] = text
+                
+                if company_data:
+                    company_data['source'] = f'table_{table_index+1}_row_{j+1}'
+                    yield company_data
+                    if self.debug:
+                        self.debug_print(f"Found company from table: {company_data}")
     
-    def extract_from_divs(self):
+    def extract_from_divs(self, tree):
         """Extract data from div elements with specific classes"""
-        companies = []
         try:
-            # Look for common class patterns
-            selectors = [
-                "*[class*='company']",
-                "*[class*='earnings']",
-                "*[class*='symbol']",
-                "*[class*='ticker']",
-                "*[class*='eps']",
-                "*[id*='company']",
-                "*[id*='earnings']",
-                "*[class*='cal']",
-                ".stock",
-                ".earning"
-            ]
-            
-            for selector in selectors:
+            # One walk over the tree for all the class/id patterns; each element is read once and
+            # labelled with the first CSS selector it matches. The per-selector scan went selector by
+            # selector, and the first record wins score ties in the sink (a .calendar wrapper and the
+            # .company card inside it), so elements are stable-sorted back into that order
+            elements = sorted(((_div_selector_index(element), element) for element in _DIV_XPATH(tree)),
+                              key=lambda pair: pair[0])
+            self.debug_print(f"Found {len(elements)} elements matching the company/earnings selectors")
+            
+            for index, element in elements:
                 try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    self.debug_print(f"Found {len(elements)} elements with selector: {selector}")
-                    
-                    for element in elements:
-                        try:
-                            text = element.text.strip()
-                            if text:
-                                # Try to extract symbol from text
-                                symbol_match = re.search(r'\b([A-Z]{1,5})\b', text)
-                                if symbol_match:
-                                    company_data = {
-                                        'symbol': symbol_match.group(1),
-                                        'raw_text': text,
-                                        'source': selector
-                                    }
-                                    companies.append(company_data)
-                                    self.debug_print(f"Found company from div: {company_data}")
-                                    
-                        except Exception as e:
-                            self.debug_print(f"Error processing element: {e}")
+                    text = inner_text(element)
+                    if text:
+                        # Try to extract symbol from text
+                        symbol_match = _TICKER_RE.search(text)
+                        if symbol_match:
+                            company_data = {
+                                'symbol': symbol_match.group(1),
+                                'raw_text': text,
+                                'source': _DIV_SELECTORS[index][0]
+                            }
+                            yield company_data
+                            if self.debug:
+                                self.debug_print(f"Found company from div: {company_data}")
                             
                 except Exception as e:
-                    self.debug_print(f"Error with selector {selector}: {e}")
+                    self.debug_print(f"Error processing element: {e}")
                     
         except Exception as e:
             self.debug_print(f"Error extracting from divs: {e}")
-        
-        return companies
     
-    def extract_from_data_attributes(self):
+    def extract_from_data_attributes(self, tree):
         """Extract data from elements with data attributes"""
-        companies = []
         try:
             # Look for data attributes
-            selectors = [
-                "[data-symbol]",
-                "[data-company]",
-                "[data-ticker]",
-                "[data-eps]",
-                "[data-earnings]"
-            ]
-            
-            for selector in selectors:
+            for selector_attr, xpath in _DATA_ATTRIBUTE_XPATHS.items():
+                selector = f"[{selector_attr}]"
                 try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    elements = xpath(tree)
                     self.debug_print(f"Found {len(elements)} elements with selector: {selector}")
                     
                     for element in elements:
@@ -518,15 +1390,16 @@ class EarningsSeleniumScraper:
                             company_data = {}
                             
                             # Extract data attributes
-                            for attr in ['data-symbol', 'data-company', 'data-ticker', 'data-eps', 'data-earnings']:
-                                value = element.get_attribute(attr)
+                            for attr in _DATA_ATTRIBUTES:
+                                value = element.get(attr)
                                 if value:
                                     company_data[attr.replace('data-', '')] = value
                             
                             if company_data:
                                 company_data['source'] = selector
-                                companies.append(company_data)
-                                self.debug_print(f"Found company from data attributes: {company_data}")
+                                yield company_data
+                                if self.debug:
+                                    self.debug_print(f"Found company from data attributes: {company_data}")
                                 
                         except Exception as e:
                             self.debug_print(f"Error processing data attribute element: {e}")
@@ -536,136 +1409,97 @@ class EarningsSeleniumScraper:
                     
         except Exception as e:
             self.debug_print(f"Error extracting from data attributes: {e}")
-        
-        return companies
     
-    def extract_from_text_patterns(self):
-        """Extract data using text pattern matching"""
-        companies = []
+    def extract_from_text_patterns(self, body_text):
+        """Extract data using text pattern matching on the body's visible text"""
         try:
-            # Get all text content from the body
-            body_text = self.driver.find_element(By.TAG_NAME, "body").text
-            
-            # Look for stock ticker patterns in context
-            lines = body_text.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line:
-                    # Look for patterns like "AAPL - Apple Inc." or "MSFT $2.50"
-                    ticker_matches = re.findall(r'\b([A-Z]{1,5})\b', line)
-                    
-                    # Filter out common false positives
-                    false_positives = {
-                        'AM', 'PM', 'EST', 'PST', 'GMT', 'UTC', 'USD', 'CEO', 'CFO', 'EPS', 
-                        'Q1', 'Q2', 'Q3', 'Q4', 'THE', 'AND', 'FOR', 'BUT', 'NOT', 'YOU',
-                        'ALL', 'CAN', 'HAD', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'DAY', 'GET',
-                        'USE', 'MAN', 'NEW', 'NOW', 'WAY', 'MAY', 'SAY', 'SUN', 'MON', 'TUE',
-                        'WED', 'THU', 'FRI', 'SAT', 'JAN', 'FEB', 'MAR', 'APR', 'JUN', 'JUL',
-                        'AUG', 'SEP', 'OCT', 'NOV', 'DEC', 'TOP', 'END', 'KEY', 'OPEN', 'BMO',
-                        'AMC', 'TBD', 'NONE', 'VIEW', 'LIST', 'ONLY', 'ET', 'PT', 'CT', 'MT'
+            # Look for stock ticker patterns in context; one regex pass picks out just the
+            # lines with financial context, so other lines are never split or copied
+            for match in _FINANCIAL_LINE_RE.finditer(body_text):
+                line = match.group(1).strip()
+                
+                # Look for patterns like "AAPL - Apple Inc." or "MSFT $2.50"
+                ticker_matches = _TICKER_RE.findall(line)
+                
+                # Filter out common false positives; a ticker repeated on one line would give
+                # identical records, so keep first occurrences
+                valid_tickers = [t for t in dict.fromkeys(ticker_matches) if t not in _FALSE_POSITIVES]
+                
+                for ticker in valid_tickers:
+                    company_data = {
+                        'symbol': ticker,
+                        'context_line': line,
+                        'source': 'text_pattern'
                     }
+                    yield company_data
+                    if self.debug:
+                        self.debug_print(f"Found company from text: {company_data}")
                     
-                    valid_tickers = [t for t in ticker_matches if t not in false_positives]
-                    
-                    for ticker in valid_tickers:
-                        # Additional validation - check if line has financial context
-                        if any(word in line.lower() for word in ['earnings', 'eps', '$', 'revenue', 'profit', 'consensus', 'estimate', 'whisper']):
-                            company_data = {
-                                'symbol': ticker,
-                                'context_line': line,
-                                'source': 'text_pattern'
-                            }
-                            companies.append(company_data)
-                            self.debug_print(f"Found company from text: {company_data}")
-                            
         except Exception as e:
             self.debug_print(f"Error extracting from text patterns: {e}")
-        
-        return companies
     
-    def extract_from_page_source(self):
+    def extract_from_page_source(self, page_source):
         """Extract data from raw page source"""
-        companies = []
         try:
-            page_source = self.driver.page_source
-            
-            # Look for JSON data patterns
-            json_patterns = [
-                r'"symbol"\s*:\s*"([A-Z]{1,5})"',
-                r'"ticker"\s*:\s*"([A-Z]{1,5})"',
-                r'"Symbol"\s*:\s*"([A-Z]{1,5})"'
-            ]
-            
-            for pattern in json_patterns:
-                matches = re.findall(pattern, page_source)
-                for match in matches:
-                    company_data = {
-                        'symbol': match,
-                        'source': 'page_source_json'
-                    }
-                    companies.append(company_data)
+            # Look for JSON data patterns ("symbol", "ticker" or "Symbol" keys in one scan)
+            # A symbol repeated in the JSON yields identical records, so emit each one once (in order)
+            for match in dict.fromkeys(_JSON_SYMBOL_RE.findall(page_source)):
+                company_data = {
+                    'symbol': match,
+                    'source': 'page_source_json'
+                }
+                yield company_data
+                if self.debug:
                     self.debug_print(f"Found company from page source: {company_data}")
             
-            # Look for JavaScript function calls with stock symbols
-            js_patterns = [
-                r'getcalctrls\(["\'](\d{8})["\']',  # Date extraction
-                r'adddownload\(["\'](\d{8})["\']'    # Download function
-            ]
-            
-            for pattern in js_patterns:
-                matches = re.findall(pattern, page_source)
-                self.debug_print(f"Found JS pattern matches: {matches}")
+            # Look for JavaScript function calls with stock symbols (diagnostic only, so skip
+            # rescanning the whole page source unless debugging)
+            if self.debug:
+                calls = _JS_DATE_RE.findall(page_source)
+                self.debug_print(f"Found JS pattern matches: {[calctrls for calctrls, _ in calls if calctrls]}")
+                self.debug_print(f"Found JS pattern matches: {[download for _, download in calls if download]}")
                 
         except Exception as e:
             self.debug_print(f"Error extracting from page source: {e}")
-        
-        return companies
     
-    def extract_from_ew_patterns(self):
+    def extract_from_ew_patterns(self, tree):
         """Extract data using EarningsWhispers-specific patterns"""
-        companies = []
         try:
-            # Look for specific EarningsWhispers calendar patterns
-            # Check for calendar grid or list structures
-            ew_selectors = [
-                "[id*='showcal']",
-                "[class*='showcal']",
-                "[id*='calctrl']",
-                "[class*='calendar']",
-                ".showlist",
-                "#showcal"
-            ]
-            
-            for selector in ew_selectors:
+            # Look for specific EarningsWhispers calendar patterns (calendar grid or list structures)
+            # Every EW record for a symbol scores the same in add_company, where the first one wins,
+            # so later sightings (nested or overlapping elements, other selectors) are dropped here
+            seen = set()
+            # An element's innerHTML is contained in that of any ancestor, so once an element has
+            # been scanned, neither it nor anything inside it can turn up a new symbol
+            scanned = set()
+            
+            for selector, xpath in _EW_SELECTORS:
                 try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    elements = xpath(tree)
                     self.debug_print(f"Found {len(elements)} EW-specific elements with selector: {selector}")
                     
                     for element in elements:
+                        if element in scanned or any(ancestor in scanned for ancestor in element.iterancestors()):
+                            continue
+                        scanned.add(element)
                         try:
                             # Get inner HTML to look for calendar data
-                            inner_html = element.get_attribute('innerHTML')
+                            inner_html = element_inner_html(element)
                             
                             # Look for stock symbols in the calendar content
-                            symbol_matches = re.findall(r'\b([A-Z]{2,5})\b', inner_html)
-                            
-                            false_positives = {
-                                'HTML', 'DIV', 'SPAN', 'CLASS', 'STYLE', 'HREF', 'SRC', 'ALT',
-                                'TEXT', 'FONT', 'SIZE', 'COLOR', 'BOLD', 'LINK', 'BUTTON',
-                                'FORM', 'INPUT', 'TABLE', 'TBODY', 'THEAD', 'CELL', 'ROW',
-                                'AM', 'PM', 'ET', 'PT', 'CT', 'MT', 'EST', 'PST', 'GMT', 'UTC'
-                            }
-                            
-                            valid_symbols = [s for s in symbol_matches if s not in false_positives]
+                            symbol_matches = _EW_SYMBOL_RE.findall(inner_html)
                             
-                            for symbol in valid_symbols:
+                            for symbol in symbol_matches:
+                                if symbol in seen or symbol in _EW_FALSE_POSITIVES:
+                                    continue
+                                seen.add(symbol)
                                 company_data = {
                                     'symbol': symbol,
-                                    'source': f'ew_pattern_{selector}',
-                                    'raw_html': inner_html[:200]  # First 200 chars for context
+                                    'source': f'ew_pattern_{selector}'
                                 }
-                                companies.append(company_data)
-                                self.debug_print(f"Found company from EW pattern: {company_data}")
+                                yield company_data
+                                if self.debug:
+                                    self.debug_print(f"Found company from EW pattern: {company_data}")
                                 
                         except Exception as e:
                             self.debug_print(f"Error processing EW element: {e}")
@@ -675,68 +1509,46 @@ class EarningsSeleniumScraper:
                     
         except Exception as e:
             self.debug_print(f"Error extracting from EW patterns: {e}")
-        
-        return companies
     
-    def deduplicate_companies(self, companies):
-        """Remove duplicate companies and clean the data"""
-        symbol_to_best_company = {}
+    def add_company(self, sink, company):
+        """
+        Stream one extracted record into sink (symbol -> (score, record)), keeping only
+        the record with the most data for each symbol; the first one wins ties.
+        Returns the canonical symbol, or None if the record was rejected.
+        """
+        symbol = _canon(company.get('symbol', ''))
         
-        for company in companies:
-            symbol = company.get('symbol', '').upper().strip()
-            
-            # Skip if symbol is invalid
-            if not symbol or len(symbol) > 5:
-                continue
-                
-            # Additional validation - must be valid stock symbol format
-            if not re.match(r'^[A-Z]{1,5}$', symbol):
-                continue
-                
-            # Skip common false positives that might have slipped through
-            false_positives = {
-                'AM', 'PM', 'ET', 'PT', 'CT', 'MT', 'EST', 'PST', 'GMT', 'UTC',
-                'HTML', 'DIV', 'SPAN', 'CLASS', 'STYLE', 'HREF', 'SRC', 'ALT',
-                'TEXT', 'FONT', 'SIZE', 'COLOR', 'BOLD', 'LINK', 'BUTTON',
-                'FORM', 'INPUT', 'TABLE', 'TBODY', 'THEAD', 'CELL', 'ROW',
-                'CEO', 'CFO', 'EPS', 'Q1', 'Q2', 'Q3', 'Q4', 'THE', 'AND',
-                'FOR', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HAD', 'HER', 'WAS',
-                'ONE', 'OUR', 'OUT', 'DAY', 'GET', 'USE', 'MAN', 'NEW', 'NOW',
-                'WAY', 'MAY', 'SAY', 'TOP', 'END', 'KEY', 'OPEN', 'BMO', 'AMC',
-                'TBD', 'NONE', 'VIEW', 'LIST', 'ONLY'
-            }
-            
-            if symbol in false_positives:
-                continue
-            
-            # Calculate data richness score for this company
-            data_score = self.calculate_data_richness(company)
-            
-            # Keep the best version (highest data score) for each symbol
-            if symbol not in symbol_to_best_company or data_score > symbol_to_best_company[symbol]['score']:
-                symbol_to_best_company[symbol] = {
-                    'company': company,
-                    'score': data_score
-                }
+        # Skip invalid symbols and common false positives that might have slipped through
+        if not _is_valid_symbol(symbol):
+            return None
+        
+        # Calculate data richness score for this company
+        data_score = self.calculate_data_richness(company)
         
-        # Process the best companies
+        # Keep the best version (highest data score) for each symbol
+        best = sink.get(symbol)
+        if best is None or data_score > best[0]:
+            sink[symbol] = (data_score, company)
+        return symbol
+    
+    def clean_companies(self, sink):
+        """Clean the best record kept for each symbol"""
         unique_companies = []
-        for symbol, best_data in symbol_to_best_company.items():
-            company = best_data['company']
-            
-            # Clean up the company data
-            cleaned_company = {
-                'symbol': symbol,
-                'source': company.get('source', 'unknown')
-            }
-            
-            # Add other fields if they exist and are meaningful
-            if 'company_name' in company and company['company_name']:
-                cleaned_company['company_name'] = company['company_name'].strip()
-            if 'raw_text' in company and company['raw_text'] and len(company['raw_text']) < 500:
-                cleaned_company['raw_text'] = company['raw_text'].strip()
-            if 'context_line' in company and company['context_line']:
-                cleaned_company['context_line'] = company['context_line'].strip()
+        for symbol, (_, company) in sink.items():
+            
+            company_name = company.get('company_name')
+            raw_text = company.get('raw_text')
+            context_line = company.get('context_line')
+            
+            # Clean up the company data in one build, keeping other fields only if they exist
+            # and are meaningful
+            cleaned_company = {key: value for key, value in (
+                ('symbol', symbol),
+                ('source', company.get('source', 'unknown')),
+                ('company_name', company_name.strip() if company_name else None),
+                ('raw_text', raw_text.strip() if raw_text and len(raw_text) < 500 else None),
+                ('context_line', context_line.strip() if context_line else None),
+            ) if value is not None}
                 
             # Extract financial data from raw text
             financial_data = self.extract_financial_data(company)
@@ -745,37 +1557,37 @@ class EarningsSeleniumScraper:
                 
             unique_companies.append(cleaned_company)
             
-        self.debug_print(f"Deduplicated from {len(companies)} to {len(unique_companies)} companies")
+        self.debug_print(f"Kept {len(unique_companies)} unique companies")
         return unique_companies
     
     def calculate_data_richness(self, company):
         """Calculate how much useful data a company entry contains"""
         score = 0
+        raw_text = company.get('raw_text', '')
+        context_line = company.get('context_line', '')
+        company_name = company.get('company_name', '')
+        reported_revenue = company.get('reported_revenue', '')
         
         # Score based on presence of fields
-        if 'company_name' in company and company['company_name']:
+        if company_name:
             score += 10
-        if 'reported_revenue' in company and company['reported_revenue']:
+        if reported_revenue:
             score += 100  # High priority for reported revenue
-        if 'raw_text' in company and company['raw_text']:
-            score += len(company['raw_text'])  # Longer text = more data
-        if 'context_line' in company and company['context_line']:
-            score += len(company['context_line'])
+        if raw_text:
+            score += len(raw_text)  # Longer text = more data
+        if context_line:
+            score += len(context_line)
         
-        # Bonus for financial indicators
-        text_content = ' '.join([
-            company.get('raw_text', ''),
-            company.get('context_line', ''),
-            company.get('company_name', ''),
-            company.get('reported_revenue', '')
-        ]).lower()
+        # Bonus for financial indicators (one lowered copy, each phrase looked up once)
+        text_content = f"{raw_text} {context_line} {company_name} {reported_revenue}".lower()
         
         if 'reported revenue' in text_content:
             score += 80  # Higher priority for reported revenue
-        elif 'revenue' in text_content and 'estimate' not in text_content:
-            score += 50  # Regular revenue but not estimate
         elif 'revenue' in text_content:
-            score += 20  # Revenue estimate (lower priority)
+            if 'estimate' not in text_content:
+                score += 50  # Regular revenue but not estimate
+            else:
+                score += 20  # Revenue estimate (lower priority)
             
         if 'bil' in text_content or 'million' in text_content:
             score += 30
@@ -787,19 +1599,13 @@ class EarningsSeleniumScraper:
         return score
     
     def load_tracking_list(self):
-        """Load the tracking list from tracking_list.txt"""
-        tracking_list = set()
+        """Load the tracking list from tracking_list.txt (re-read only when the file changes)"""
+        tracking_list = frozenset()
         tracking_file = "tracking_list.txt"
         
         try:
             if os.path.exists(tracking_file):
-                with open(tracking_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip().upper()
-                        # Skip empty lines and comments
-                        if line and not line.startswith('#'):
-                            tracking_list.add(line)
-                            
+                tracking_list = _read_tracking_list(tracking_file, os.stat(tracking_file).st_mtime_ns)
                 self.debug_print(f"Loaded {len(tracking_list)} symbols from tracking list: {sorted(tracking_list)}")
             else:
                 self.debug_print("No tracking_list.txt file found - using empty tracking list")
@@ -811,114 +1617,53 @@ class EarningsSeleniumScraper:
     
     def extract_financial_data(self, company):
         """Extract revenue and growth data from company text"""
-        financial_data = {}
-        
-        # Get all text sources
-        text_sources = []
-        if 'raw_text' in company:
-            text_sources.append(company['raw_text'])
-        if 'context_line' in company:
-            text_sources.append(company['context_line'])
-        if 'company_name' in company:
-            text_sources.append(company['company_name'])
-        if 'reported_revenue' in company:
-            text_sources.append(f"Reported Revenue: {company['reported_revenue']}")
-        
-        combined_text = ' '.join(text_sources)
-        
-        # Extract revenue (prioritize "Reported Revenue" over "Revenue Estimate")
-        revenue_patterns = [
-            # First try to find "Reported Revenue" specifically
-            r'Reported Revenue:\s*\$?([0-9,]+(?:\.[0-9]+)?)\s*(Bil|Billion|B)',
-            r'Reported Revenue:\s*\$?([0-9,]+(?:\.[0-9]+)?)\s*(Mil|Million|M)',
-            r'Reported\s+Revenue[:\s]*\$?([0-9,]+(?:\.[0-9]+)?)\s*(Bil|Billion|B)',
-            r'Reported\s+Revenue[:\s]*\$?([0-9,]+(?:\.[0-9]+)?)\s*(Mil|Million|M)',
-            # Fallback to general revenue patterns (avoiding "Estimate")
-            r'Revenue:\s*\$?([0-9,]+(?:\.[0-9]+)?)\s*(Bil|Billion|B)(?!\s*Estimate)',
-            r'Revenue:\s*\$?([0-9,]+(?:\.[0-9]+)?)\s*(Mil|Million|M)(?!\s*Estimate)',
-            r'\$([0-9,]+(?:\.[0-9]+)?)\s*(Bil|Billion|B)(?!\s*Estimate)',
-            r'\$([0-9,]+(?:\.[0-9]+)?)\s*(Mil|Million|M)(?!\s*Estimate)',
-            r'([0-9,]+(?:\.[0-9]+)?)\s*(Bil|Billion|B)\s*Revenue(?!\s*Estimate)',
-            r'([0-9,]+(?:\.[0-9]+)?)\s*(Mil|Million|M)\s*Revenue(?!\s*Estimate)'
-        ]
-        
-        for pattern in revenue_patterns:
-            match = re.search(pattern, combined_text, re.IGNORECASE)
-            if match:
-                amount = float(match.group(1).replace(',', ''))
-                unit = match.group(2).lower()
-                
-                # Convert to millions
-                if unit.startswith('bil') or unit == 'b':
-                    revenue_millions = amount * 1000
-                else:  # mil, million, m
-                    revenue_millions = amount
-                    
-                financial_data['revenue_millions'] = revenue_millions
-                financial_data['revenue_raw'] = match.group(0)
-                break
-        
-        # Extract growth rate
-        growth_patterns = [
-            r'([+-]?[0-9]+(?:\.[0-9]+)?)\s*%',
-            r'([+-]?[0-9]+(?:\.[0-9]+)?)\s*percent',
-            r'growth:\s*([+-]?[0-9]+(?:\.[0-9]+)?)\s*%'
-        ]
-        
-        for pattern in growth_patterns:
-            match = re.search(pattern, combined_text, re.IGNORECASE)
-            if match:
-                growth_rate = float(match.group(1))
-                financial_data['growth_rate'] = growth_rate
-                financial_data['growth_raw'] = match.group(0)
-                break
-        
-        return financial_data if financial_data else None
+        return _extract_financial_data(company)
     
     def filter_companies_by_criteria(self, companies, tracking_list=None):
         """Filter companies based on revenue and growth criteria"""
         filtered_companies = []
         
         if tracking_list is None:
-            tracking_list = set()
-        else:
-            tracking_list = set(symbol.upper().strip() for symbol in tracking_list)
+            tracking_list = frozenset()
+        # Callers pass canonical symbols (as load_tracking_list returns them), so no rebuild here
+        assert isinstance(tracking_list, (set, frozenset)), "tracking_list must be a set of canonical symbols"
+        
+        debug = self.debug
+        meets_criteria = self.meets_criteria
+        format_filtered_company = self.format_filtered_company
         
         for company in companies:
             symbol = company.get('symbol', '')
-            revenue = company.get('revenue_millions', 0)
-            growth = company.get('growth_rate', 0)
             
             # Check if company is in tracking list
             if symbol in tracking_list:
-                self.debug_print(f"{symbol}: In tracking list")
-                filtered_companies.append(self.format_filtered_company(company, reason="tracking_list"))
+                if debug:
+                    self.debug_print(f"{symbol}: In tracking list")
+                filtered_companies.append(format_filtered_company(company, reason="tracking_list"))
                 continue
             
+            revenue = company.get('revenue_millions', 0)
+            growth = company.get('growth_rate', 0)
+            
             # Apply revenue and growth criteria
-            if self.meets_criteria(revenue, growth):
-                self.debug_print(f"{symbol}: Meets criteria - Revenue: ${revenue}M, Growth: {growth}%")
-                filtered_companies.append(self.format_filtered_company(company, reason="revenue_growth_criteria"))
-            else:
+            if meets_criteria(revenue, growth):
+                if debug:
+                    self.debug_print(f"{symbol}: Meets criteria - Revenue: ${revenue}M, Growth: {growth}%")
+                filtered_companies.append(format_filtered_company(company, reason="revenue_growth_criteria"))
+            elif debug:
                 self.debug_print(f"{symbol}: Does not meet criteria - Revenue: ${revenue}M, Growth: {growth}%")
         
         return filtered_companies
     
     def meets_criteria(self, revenue, growth):
         """Check if company meets any of the filtering criteria"""
-        criteria = [
-            (10, 50),      # >10M revenue and >50% growth
-            (100, 30),     # >100M revenue and >30% growth  
-            (500, 25),     # >500M revenue and >25% growth
-            (1000, 20),    # >1000M revenue and >20% growth
-            (5000, 15),    # >5000M revenue and >15% growth
-        ]
-        
-        for min_revenue, min_growth in criteria:
-            if revenue > min_revenue and growth > min_growth:
-                return True
-        
-        return False
+        # Most rows clear no tier at all: below the lowest revenue bar or the lowest growth bar
+        if revenue <= _CRITERIA_REVENUE[0] or growth <= _CRITERIA_GROWTH[-1]:
+            return False
+        # Growth requirements fall as revenue rises, so only the highest revenue tier the
+        # company clears matters
+        tier = bisect.bisect_left(_CRITERIA_REVENUE, revenue)
+        return growth > _CRITERIA_GROWTH[tier - 1]
     
     def format_filtered_company(self, company, reason="unknown"):
         """Format company data for filtered output"""
@@ -942,8 +1687,9 @@ class EarningsSeleniumScraper:
         print(f"\nFiltered Companies Summary ({len(filtered_companies)} companies):")
         print("=" * 80)
         
+        # Tickers were canonicalised in add_company
         for i, company in enumerate(filtered_companies):
-            ticker = company.get('ticker', '').upper()
+            ticker = company.get('ticker', '')
             name = company.get('name', '')
             revenue = company.get('revenue_raw', 'N/A')
             growth = company.get('growth_raw', 'N/A')
@@ -961,7 +1707,7 @@ class EarningsSeleniumScraper:
         print("=" * 60)
         
         for i, company in enumerate(filtered_companies):
-            ticker = company.get('ticker', '').upper()
+            ticker = company.get('ticker', '')
             if not ticker:
                 continue
                 
@@ -971,17 +1717,27 @@ class EarningsSeleniumScraper:
         print("=" * 60)
     
     def save_to_file(self, data, filename):
-        """Save scraped data to a JSON file"""
+        """Save scraped data to a JSON file (pretty-printed only when debugging)"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS
+                if self.debug:
+                    option |= orjson.OPT_INDENT_2
+                payload = orjson.dumps(data, option=option)
+            elif self.debug:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            else:
+                payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+            with open(filename, 'wb') as f:
+                f.write(payload)
             print(f"Data saved to {filename}")
         except Exception as e:
             print(f"Error saving to file: {e}")
     
     def close(self, force=False):
         """Close the WebDriver"""
-        if hasattr(self, 'driver'):
+        self.flush_debug()
+        if self.driver is not None:
             if force:
                 self.driver.quit()
             else:
@@ -990,9 +1746,24 @@ class EarningsSeleniumScraper:
 
 def main():
     """Main function to run the scraper"""
+    parser = argparse.ArgumentParser(description="Scrape the EarningsWhispers calendar")
+    parser.add_argument('dates', nargs='*', metavar='YYYYMMDD',
+                        help="Dates to scrape (default: today in Eastern Time)")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Dates scraped concurrently, each on its own browser when Chrome is needed")
+    parser.add_argument('--selenium-fallback', action='store_true',
+                        help="Launch Chrome for pages that need JavaScript to render the calendar")
+    parser.add_argument('--force-refresh', action='store_true',
+                        help="Re-fetch calendars even if they are already cached")
+    args = parser.parse_args()
+    
     scraper = None
+    pool = None
     try:
-        scraper = EarningsSeleniumScraper(headless=False, debug=True)  # Set headless=False to see browser
+        # Each concurrently scraped date gets its own browser from the pool (Set headless=False to see browser)
+        if args.selenium_fallback:
+            pool = BrowserPool(size=max(1, min(args.workers, len(args.dates) or 1)), headless=False, debug=True)
+        scraper = EarningsSeleniumScraper(headless=False, debug=True, selenium_fallback=args.selenium_fallback, pool=pool)
         
         # Use today's date in Eastern Time
         from datetime import datetime
@@ -1001,14 +1772,17 @@ def main():
         eastern = pytz.timezone('US/Eastern')
         today_eastern = datetime.now(eastern)
         today = today_eastern.strftime("%Y%m%d")
-        test_dates = [today]  # Use today's date in Eastern Time
+        test_dates = args.dates or [today]  # Use today's date in Eastern Time
+        
+        # Dates are fetched and rendered concurrently; results are reported in the order given
+        results = scraper.scrape_many(test_dates, workers=max(1, args.workers), force_refresh=args.force_refresh)
         
         for date_str in test_dates:
             print(f"\n{'='*50}")
             print(f"Testing scraper for {date_str}")
             print(f"{'='*50}")
             
-            data = scraper.scrape_calendar(date_str)
+            data = results[date_str]
             
             if data:
                 print(f"Status: {data.get('status', 'unknown')}")
@@ -1027,18 +1801,12 @@ def main():
                 print(f"\n=== EARNINGS CALENDAR SUMMARY for {date_str} ===")
                 
                 if len(companies) > 0:
-                    # Remove duplicates for display
-                    unique_companies = {}
-                    for company in companies:
-                        symbol = company.get('symbol', 'N/A')
-                        if symbol not in unique_companies:
-                            unique_companies[symbol] = company
-                    
-                    for i, (symbol, company) in enumerate(list(unique_companies.items())[:10]):
-                        print(f"  - {symbol}: {company.get('company_name', company.get('context_line', 'N/A'))}")
+                    # Extraction already keeps a single record per symbol
+                    for company in companies[:10]:
+                        print(f"  - {company.get('symbol', 'N/A')}: {company.get('company_name', company.get('context_line', 'N/A'))}")
                     
-                    if len(unique_companies) > 10:
-                        print(f"  ... and {len(unique_companies) - 10} more unique companies")
+                    if len(companies) > 10:
+                        print(f"  ... and {len(companies) - 10} more unique companies")
                 else:
                     print("  No companies found - this may be expected for future dates")
                     
@@ -1055,6 +1823,8 @@ def main():
     finally:
         if scraper:
             scraper.close()
+        if pool is not None:
+            pool.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Background file writer that batches result persistence off the scraping threads
+"""
+
+import os
+import queue
+import tempfile
+import threading
+from concurrent.futures import Future
+
+
+class BatchedFileWriter:
+    def __init__(self, max_batch=32):
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='file-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, path, payload):
+        """
+        Queue bytes to be written atomically to path.
+        Returns a Future that resolves to path once the file is durable on disk.
+        """
+        future = Future()
+        self._queue.put((path, payload, future))
+        return future
+
+    def close(self):
+        """Flush everything queued so far and stop the writer thread"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            # Drain whatever else is already queued so one pass handles the whole batch
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._write_batch([item for item in batch if item is not None])
+            if None in batch:
+                return
+
+    def _write_batch(self, batch):
+        """
+        Write and fsync every temp file first, publish them all with os.replace, then fsync each
+        directory touched so the renames themselves survive a crash
+        """
+        written = []
+        for path, payload, future in batch:
+            tmp_path = None
+            try:
+                # A unique temp name per write, so two writes to one path in a batch don't collide
+                directory = os.path.dirname(path) or '.'
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+                try:
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                # mkstemp creates the file owner-only; published files keep the usual permissions
+                os.chmod(tmp_path, 0o644)
+                written.append((path, tmp_path, future))
+            except OSError as e:
+                if tmp_path is not None:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                future.set_exception(e)
+
+        published = {}
+        for path, tmp_path, future in written:
+            try:
+                os.replace(tmp_path, path)
+                published.setdefault(os.path.dirname(path) or '.', []).append((path, future))
+            except OSError as e:
+                future.set_exception(e)
+
+        for directory, futures in published.items():
+            try:
+                _fsync_dir(directory)
+            except OSError as e:
+                for _, future in futures:
+                    future.set_exception(e)
+                continue
+            for path, future in futures:
+                future.set_result(path)
+
+
+def _fsync_dir(directory):
+    """fsync a directory so renames into it are durable; a no-op where directories can't be opened"""
+    if os.name == 'nt':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)